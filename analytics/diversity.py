@@ -17,9 +17,17 @@ import os
 import json
 from datetime import datetime, timedelta
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 # Set up logging
 logger = logging.getLogger("trade_alerts.analytics.diversity")
 
+# Signals from two strategies closer than this are considered overlapping
+OVERLAP_TOLERANCE_NS = pd.Timedelta('5min').value
+
 class DiversityAnalyzer:
     """
     Analyzes signal diversity metrics and generates reports on
@@ -34,12 +42,40 @@ class DiversityAnalyzer:
         
         logger.info("Diversity Analyzer initialized")
     
-    def calculate_overlap(self, signals_df):
+    @staticmethod
+    def _normalize_timestamps(signals_df):
+        """
+        Parses the timestamp column to datetime unless it already is one.
+        
+        Naive timestamps stay naive. Only text mixing UTC offsets, which
+        has no single zone to keep, is converted to UTC.
+        
+        Args:
+            signals_df: DataFrame containing signals data
+            
+        Returns:
+            DataFrame: Signals with a datetime timestamp column
+        """
+        if 'timestamp' not in signals_df.columns or pd.api.types.is_datetime64_any_dtype(signals_df['timestamp']):
+            return signals_df
+            
+        try:
+            timestamps = pd.to_datetime(signals_df['timestamp'])
+        except ValueError:
+            timestamps = None
+        # pandas < 2 returns an object column for mixed offsets instead of raising
+        if timestamps is None or not pd.api.types.is_datetime64_any_dtype(timestamps):
+            timestamps = pd.to_datetime(signals_df['timestamp'], utc=True)
+            
+        return signals_df.assign(timestamp=timestamps)
+    
+    def calculate_overlap(self, signals_df, strategies=None):
         """
         Calculates matrix of overlap between different strategies.
         
         Args:
             signals_df: DataFrame containing signals data
+            strategies: Optional precomputed unique strategies of signals_df
             
         Returns:
             DataFrame: Matrix of overlap percentages between strategies
@@ -48,45 +84,59 @@ class DiversityAnalyzer:
             logger.warning("Cannot calculate overlap: empty DataFrame or missing 'strategy' column")
             return pd.DataFrame()
             
-        strategies = signals_df['strategy'].unique()
-        overlap_matrix = pd.DataFrame(index=strategies, columns=strategies)
+        # Cache sorted per-strategy timestamp arrays
+        signals_df = self._normalize_timestamps(signals_df)
+        if strategies is None:
+            strategies = signals_df['strategy'].dropna().unique()
+        overlap_matrix = np.ones((len(strategies), len(strategies)), dtype=np.float64)
+        if 'timestamp' not in signals_df.columns:
+            logger.error("Error calculating overlap: missing 'timestamp' column")
+            overlap_matrix[~np.eye(len(strategies), dtype=bool)] = np.nan
+            return pd.DataFrame(overlap_matrix, index=strategies, columns=strategies)
+            
+        # NaT is dropped first: its int64 view is INT64_MIN and would wrap the window bounds
+        groups = {
+            strategy: np.sort(group['timestamp'].dropna().to_numpy(dtype='datetime64[ns]').view('int64'))
+            for strategy, group in signals_df.groupby('strategy', sort=False)
+        }
         
-        for strat1 in strategies:
-            for strat2 in strategies:
+        # Visit each unordered pair once and fill both cells from it
+        for i, strat1 in enumerate(strategies):
+            for j in range(i + 1, len(strategies)):
+                strat2 = strategies[j]
                 try:
-                    # Skip self-comparison
-                    if strat1 == strat2:
-                        overlap_matrix.loc[strat1, strat2] = 1.0
-                        continue
-                        
-                    s1 = signals_df[signals_df['strategy'] == strat1]
-                    s2 = signals_df[signals_df['strategy'] == strat2]
-                    
-                    # Ensure timestamp is datetime
-                    if not pd.api.types.is_datetime64_any_dtype(s1['timestamp']):
-                        s1['timestamp'] = pd.to_datetime(s1['timestamp'])
-                    if not pd.api.types.is_datetime64_any_dtype(s2['timestamp']):
-                        s2['timestamp'] = pd.to_datetime(s2['timestamp'])
-                    
-                    # Calculate overlapping signals within 5-minute window
-                    merged = pd.merge_asof(
-                        s1.sort_values('timestamp'),
-                        s2.sort_values('timestamp'),
-                        on='timestamp',
-                        suffixes=('_1', '_2'),
-                        direction='nearest',
-                        tolerance=pd.Timedelta('5min')
+                    overlap_matrix[i, j], overlap_matrix[j, i] = self._overlap_ratios(
+                        groups[strat1], groups[strat2]
                     )
                     
-                    # Calculate overlap ratio
-                    overlap_ratio = len(merged) / max(len(s1), len(s2)) if max(len(s1), len(s2)) > 0 else 0
-                    overlap_matrix.loc[strat1, strat2] = round(overlap_ratio, 2)
-                    
                 except Exception as e:
                     logger.error(f"Error calculating overlap for {strat1} vs {strat2}: {str(e)}")
-                    overlap_matrix.loc[strat1, strat2] = np.nan
+                    overlap_matrix[i, j] = overlap_matrix[j, i] = np.nan
                 
-        return overlap_matrix
+        return pd.DataFrame(overlap_matrix, index=strategies, columns=strategies).round(2)
+    
+    @staticmethod
+    def _overlap_ratios(ts1, ts2):
+        """
+        Calculates the share of each strategy's signals matched by the other within the overlap window.
+        
+        Args:
+            ts1: Sorted int64 nanosecond timestamps of the first strategy
+            ts2: Sorted int64 nanosecond timestamps of the second strategy
+            
+        Returns:
+            tuple: (ts1 vs ts2, ts2 vs ts1) overlap ratios relative to the larger strategy
+        """
+        largest = max(len(ts1), len(ts2))
+        if largest == 0:
+            return 0, 0
+            
+        def matched(left, right):
+            lo = np.searchsorted(right, left - OVERLAP_TOLERANCE_NS, side='left')
+            hi = np.searchsorted(right, left + OVERLAP_TOLERANCE_NS, side='right')
+            return np.count_nonzero(hi > lo)
+            
+        return matched(ts1, ts2) / largest, matched(ts2, ts1) / largest
     
     def calculate_confidence_metrics(self, signals_df):
         """
@@ -101,24 +151,17 @@ class DiversityAnalyzer:
         if signals_df.empty or 'strategy' not in signals_df.columns:
             return {}
             
-        confidence_metrics = {}
-        
-        for strategy in signals_df['strategy'].unique():
-            strategy_signals = signals_df[signals_df['strategy'] == strategy]
+        if 'confidence' not in signals_df.columns:
+            return {}
             
-            if 'confidence' in strategy_signals.columns:
-                confidence_values = strategy_signals['confidence'].dropna()
-                
-                if len(confidence_values) > 0:
-                    confidence_metrics[strategy] = {
-                        'mean': round(confidence_values.mean(), 2),
-                        'median': round(confidence_values.median(), 2),
-                        'min': round(confidence_values.min(), 2),
-                        'max': round(confidence_values.max(), 2),
-                        'count': len(confidence_values)
-                    }
+        confidence_metrics = (
+            signals_df.groupby('strategy', sort=False)['confidence']
+            .agg(['mean', 'median', 'min', 'max', 'count'])
+            .round(2)
+        )
+        confidence_metrics = confidence_metrics[confidence_metrics['count'] > 0]
                     
-        return confidence_metrics
+        return confidence_metrics.to_dict(orient='index')
 
     def calculate_time_between_signals(self, signals_df):
         """
@@ -133,26 +176,24 @@ class DiversityAnalyzer:
         if signals_df.empty or 'strategy' not in signals_df.columns:
             return {}
             
-        time_between = {}
+        signals_df = self._normalize_timestamps(signals_df)
         
-        for strategy in signals_df['strategy'].unique():
-            strategy_signals = signals_df[signals_df['strategy'] == strategy]
-            
-            # Ensure timestamp is datetime
-            if not pd.api.types.is_datetime64_any_dtype(strategy_signals['timestamp']):
-                strategy_signals['timestamp'] = pd.to_datetime(strategy_signals['timestamp'])
-                
-            if len(strategy_signals) > 1:
-                # Sort by timestamp and calculate differences
-                sorted_signals = strategy_signals.sort_values('timestamp')
-                diffs = sorted_signals['timestamp'].diff().dropna()
-                
-                if len(diffs) > 0:
-                    # Calculate mean time difference in minutes
-                    mean_diff_minutes = diffs.mean().total_seconds() / 60
-                    time_between[strategy] = round(mean_diff_minutes, 1)
+        # Sort by strategy and timestamp and calculate differences in one pass
+        sorted_signals = signals_df.sort_values(['strategy', 'timestamp'])
+        diffs_minutes = (
+            sorted_signals.groupby('strategy', sort=False)['timestamp']
+            .diff()
+            .dt.total_seconds()
+            .div(60)
+        )
+        time_between = (
+            diffs_minutes.groupby(sorted_signals['strategy'], sort=False)
+            .mean()
+            .dropna()
+            .round(1)
+        )
                     
-        return time_between
+        return time_between.to_dict()
         
     def generate_report(self, signals_df):
         """
@@ -180,20 +221,29 @@ class DiversityAnalyzer:
             return {'error': 'Missing symbol information'}
             
         try:
+            # Parse and sort timestamps once for all metrics below
+            signals_df = self._normalize_timestamps(signals_df)
+            if 'timestamp' in signals_df.columns:
+                signals_df = signals_df.sort_values('timestamp')
+                
+            # Aggregate strategies and assets once and reuse below
+            strategies = signals_df['strategy'].dropna().unique()
+            asset_counts = signals_df[symbol_col].value_counts()
+            
             # Generate the report
             report = {
                 "report_date": datetime.now().isoformat(),
                 "total_signals": len(signals_df),
-                "strategies": signals_df['strategy'].nunique(),
-                "unique_assets": signals_df[symbol_col].nunique(),
+                "strategies": len(strategies),
+                "unique_assets": len(asset_counts),
                 "date_range": {
                     "start": signals_df['timestamp'].min().isoformat() if 'timestamp' in signals_df.columns else None,
                     "end": signals_df['timestamp'].max().isoformat() if 'timestamp' in signals_df.columns else None
                 },
-                "overlap_matrix": self.calculate_overlap(signals_df).to_dict(),
+                "overlap_matrix": self.calculate_overlap(signals_df, strategies).to_dict(),
                 "confidence_metrics": self.calculate_confidence_metrics(signals_df),
                 "time_between_signals": self.calculate_time_between_signals(signals_df),
-                "asset_distribution": signals_df[symbol_col].value_counts().to_dict()
+                "asset_distribution": asset_counts.to_dict()
             }
             
             return report
@@ -221,8 +271,16 @@ class DiversityAnalyzer:
             filename = os.path.join(self.reports_dir, f"diversity_report_{date_str}.json")
             
         # Save report as JSON
-        with open(filename, 'w') as f:
-            json.dump(report, f, indent=2, default=str)
+        if orjson is not None:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(
+                    report,
+                    default=str,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+                ))
+        else:
+            with open(filename, 'w') as f:
+                json.dump(report, f, indent=2, default=str)
             
         logger.info(f"Diversity report saved to {filename}")
         return filename
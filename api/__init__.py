@@ -3,18 +3,26 @@
 API module initialization.
 """
 
+import importlib
+
 from flask import Flask
-from api.signals_api import signals_api
-from api.evaluation_api import evaluation_api
+
+# (module, attribute) pairs of the blueprints served by create_app.
+# Imported lazily so that importing an api submodule (e.g. api.fetch_data)
+# does not pull in every blueprint and its dependencies.
+BLUEPRINTS = [
+    ('api.signals_api', 'signals_api'),
+    ('api.evaluation_api', 'evaluation_api'),
+]
 
 def create_app():
     """
     Create and configure the Flask application.
     """
     app = Flask(__name__)
-    
+
     # Register blueprints
-    app.register_blueprint(signals_api)
-    app.register_blueprint(evaluation_api)
-    
+    for module_name, attr in BLUEPRINTS:
+        app.register_blueprint(getattr(importlib.import_module(module_name), attr))
+
     return app
@@ -10,7 +10,9 @@ import numpy as np
 import requests
 import time
 import os
+import threading
 from datetime import datetime, timedelta
+from functools import lru_cache
 from typing import List, Dict, Optional, Union
 
 # Try to import pybit, but don't fail if not installed
@@ -25,6 +27,9 @@ API_KEY = os.getenv("BYBIT_API_KEY", "")
 API_SECRET = os.getenv("BYBIT_API_SECRET", "")
 TESTNET = os.getenv("USE_TESTNET", "True").lower() in ("true", "1", "t")
 
+# Seconds a V5 ticker response is reused for repeated lookups of the same symbol
+TICKER_CACHE_TTL = 1.0
+
 class BybitAPI:
     """Bybit API wrapper class."""
     
@@ -41,6 +46,10 @@ class BybitAPI:
         self.api_secret = api_secret
         self.testnet = testnet
         
+        # symbol -> (monotonic fetch time, ticker dict) for get_ticker_v5
+        self._ticker_cache: Dict[str, tuple] = {}
+        self._ticker_lock = threading.Lock()
+        
         try:
             # Initialize legacy API client for backward compatibility
             self.client = usdt_perpetual.HTTP(
@@ -101,9 +110,7 @@ class BybitAPI:
             
             # Convert string columns to numeric
             numeric_columns = ["open", "high", "low", "close", "volume", "turnover"]
-            for col in numeric_columns:
-                if col in df.columns:
-                    df[col] = pd.to_numeric(df[col])
+            df = df.astype({col: "float64" for col in numeric_columns if col in df.columns})
             
             # Convert timestamp to datetime
             if "open_time" in df.columns:
@@ -135,11 +142,7 @@ class BybitAPI:
             if "result" not in response or not response["result"]:
                 return {}
                 
-            for item in response["result"]:
-                if item["symbol"] == symbol:
-                    return item
-                    
-            return {}
+            return next((item for item in response["result"] if item["symbol"] == symbol), {})
             
         except Exception as e:
             print(f"Error fetching ticker: {e}")
@@ -194,6 +197,9 @@ class BybitAPI:
         """
         Get latest ticker data for a symbol using V5 API.
         
+        Responses are reused for TICKER_CACHE_TTL seconds so bursts of
+        lookups for the same symbol make a single request.
+        
         Args:
             symbol: Trading pair symbol (e.g., "BTCUSDT")
             
@@ -203,6 +209,11 @@ class BybitAPI:
         if not self.unified_client:
             return {}
             
+        with self._ticker_lock:
+            fetched_at, cached = self._ticker_cache.get(symbol, (0.0, None))
+        if cached is not None and time.monotonic() - fetched_at < TICKER_CACHE_TTL:
+            return cached
+            
         try:
             response = self.unified_client.get_tickers(
                 category="linear",
@@ -214,7 +225,7 @@ class BybitAPI:
                 
             ticker_data = response["result"]["list"][0]
             
-            return {
+            ticker = {
                 "symbol": ticker_data["symbol"],
                 "price": float(ticker_data["lastPrice"]),
                 "bid": float(ticker_data["bid1Price"]),
@@ -225,16 +236,35 @@ class BybitAPI:
                 "low": float(ticker_data["lowPrice24h"])
             }
             
+            with self._ticker_lock:
+                self._ticker_cache[symbol] = (time.monotonic(), ticker)
+            
+            return ticker
+            
         except Exception as e:
             print(f"Error fetching ticker: {e}")
             return {}
 
 
+@lru_cache(maxsize=1)
+def _get_api() -> "BybitAPI":
+    """
+    Get the shared BybitAPI instance.
+    
+    Reusing one instance keeps the pybit clients, and their connection
+    pools, alive across calls.
+    
+    Returns:
+        Cached BybitAPI instance
+    """
+    return BybitAPI()
+
+
 def get_candles(symbol: str, interval: str = "60", limit: int = 200) -> pd.DataFrame:
     """
     Fetch candle data from Bybit and convert to DataFrame.
     
-    This is a simplified function that creates a BybitAPI instance
+    This is a simplified function that uses the shared BybitAPI instance
     and fetches candle data for the specified symbol.
     
     Args:
@@ -246,7 +276,7 @@ def get_candles(symbol: str, interval: str = "60", limit: int = 200) -> pd.DataF
         DataFrame with OHLCV data
     """
     try:
-        api = BybitAPI()
+        api = _get_api()
         df = api.get_kline_data(symbol, interval, limit)
         
         if df.empty:
@@ -297,27 +327,28 @@ def mock_candles(symbol: str, days: int = 30, interval: str = "60") -> pd.DataFr
     timestamps = pd.date_range(start=start_time, end=end_time, periods=num_candles)
     
     # Generate random price data with trend and volatility
-    np.random.seed(42)  # For reproducibility
+    # Local generator for reproducibility without touching the global NumPy seed
+    rng = np.random.default_rng(42)
     
     # Base price and trend
     base_price = 1000 if "BTC" in symbol else 100
-    trend = np.random.choice([-1, 1]) * 0.0001  # Small upward or downward trend
+    trend = rng.choice([-1, 1]) * 0.0001  # Small upward or downward trend
     
     # Generate close prices with random walk
     volatility = base_price * 0.01  # 1% daily volatility
-    returns = np.random.normal(trend, volatility, num_candles) / np.sqrt(candles_per_day)
+    returns = rng.normal(trend, volatility, num_candles) / np.sqrt(candles_per_day)
     close_prices = base_price * (1 + np.cumsum(returns))
     
     # Generate OHLC based on close prices
-    candle_range = volatility * np.random.random(num_candles) * np.sqrt(1/candles_per_day)
+    candle_range = volatility * rng.random(num_candles) * np.sqrt(1/candles_per_day)
     
     high_prices = close_prices + candle_range
     low_prices = close_prices - candle_range
-    open_prices = close_prices - candle_range * np.random.random(num_candles) * 2 + candle_range
+    open_prices = close_prices - candle_range * rng.random(num_candles) * 2 + candle_range
     
     # Generate volumes
     avg_volume = base_price * 10
-    volumes = avg_volume * (1 + 0.5 * np.random.random(num_candles))
+    volumes = avg_volume * (1 + 0.5 * rng.random(num_candles))
     
     # Create DataFrame
     df = pd.DataFrame({
@@ -341,7 +372,7 @@ def get_ticker(symbol: str) -> Dict:
         Dictionary with ticker data including current price and timestamp
     """
     try:
-        api = BybitAPI()
+        api = _get_api()
         
         # Try to use V5 API first
         ticker = api.get_ticker_v5(symbol)
@@ -356,13 +387,13 @@ def get_ticker(symbol: str) -> Dict:
             if "result" not in response or not response["result"]:
                 return {}
                 
-            for item in response["result"]:
-                if item["symbol"] == symbol:
-                    return {
-                        "symbol": item["symbol"],
-                        "price": float(item["last_price"]),
-                        "timestamp": time.time(),  # Use local time as fallback
-                    }
+            item = next((item for item in response["result"] if item["symbol"] == symbol), None)
+            if item:
+                return {
+                    "symbol": item["symbol"],
+                    "price": float(item["last_price"]),
+                    "timestamp": time.time(),  # Use local time as fallback
+                }
                     
         return {}
             
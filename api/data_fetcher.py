@@ -4,39 +4,83 @@ Data fetcher module for retrieving market data from exchanges.
 """
 
 import json
+import numpy as np
 import pandas as pd
-import requests
 import os
+import time
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import Optional
 
-# Load configuration
+from api.http_session import SESSION, parse_json
+from utils.caching import disk_cache, ttl_cache
+
+# Disk cache lifetimes in seconds
+HISTORY_CACHE_TTL = 90 * 24 * 3600  # Closed candles never change
+SYMBOLS_CACHE_TTL = 24 * 3600
+
+# In-process copy of the symbols list, refreshed at most once per SYMBOLS_MEMORY_TTL
+SYMBOLS_MEMORY_TTL = 3600
+_symbols_cache = {"at": 0.0, "data": None}
+
+# Per-symbol live prices are reused for this many seconds
+PRICE_CACHE_TTL = 0.5
+
+# Snapshot of all tickers' last prices, shared by callers within PRICES_CACHE_TTL
+PRICES_CACHE_TTL = 1.0
+_prices_cache = {"at": 0.0, "data": {}}
+
+@dataclass(frozen=True)
+class FetcherConfig:
+    """Exchange settings used by the data fetcher."""
+    api_key: str = ""
+    api_secret: str = ""
+    testnet: bool = False
+    category: str = "linear"
+    symbol: str = "BTCUSDT"
+    interval: int = 60
+
+def load_config(path: str) -> FetcherConfig:
+    """
+    Load fetcher settings from a JSON file, ignoring unrelated keys.
+    
+    Args:
+        path: Path to config.json
+        
+    Returns:
+        FetcherConfig (defaults when the file does not exist)
+    """
+    if not os.path.exists(path):
+        return FetcherConfig()
+        
+    with open(path) as f:
+        raw = json.load(f)
+    known = {field.name for field in fields(FetcherConfig)}
+    return FetcherConfig(**{key: value for key, value in raw.items() if key in known})
+
+# Load configuration once at import
 config_path = os.path.join(os.path.dirname(__file__), '../config.json')
-if os.path.exists(config_path):
-    with open(config_path) as f:
-        config = json.load(f)
-else:
-    config = {
-        "api_key": "",
-        "api_secret": "",
-        "testnet": False,
-        "category": "linear",
-        "symbol": "BTCUSDT",
-        "interval": 60
-    }
+config = load_config(config_path)
 
 try:
     from pybit.unified_trading import HTTP
     
     session = HTTP(
-        testnet=config.get("testnet", False),
-        api_key=config.get("api_key", ""),
-        api_secret=config.get("api_secret", "")
+        testnet=config.testnet,
+        api_key=config.api_key,
+        api_secret=config.api_secret
     )
 except ImportError:
     print("Warning: pybit not installed. Will use direct HTTP requests.")
     session = None
 
+def _interval_ms(interval):
+    """Length of a Bybit kline interval (minutes, 'D', 'W' or 'M') in milliseconds."""
+    interval = str(interval)
+    if interval.isdigit():
+        return int(interval) * 60_000
+    return {"D": 1, "W": 7, "M": 31}.get(interval, 31) * 86_400_000
+
 def get_historical_data(symbol=None, start=None, end=None, interval=None):
     """
     Fetch historical candlestick data from Bybit.
@@ -50,11 +94,18 @@ def get_historical_data(symbol=None, start=None, end=None, interval=None):
     Returns:
         DataFrame with OHLCV data
     """
-    symbol = symbol or config["symbol"]
-    interval = interval or config["interval"]
+    symbol = symbol or config.symbol
+    interval = interval or config.interval
     
+    # Ranges ending at least one candle ago only contain closed candles and can be cached
+    if end is not None and end + _interval_ms(interval) < time.time() * 1000:
+        return _fetch_historical_data_cached(symbol, start, end, str(interval))
+    return _fetch_historical_data(symbol, start, end, str(interval))
+
+def _fetch_historical_data(symbol, start, end, interval):
+    """Request kline data from Bybit; see get_historical_data."""
     params = {
-        "category": config["category"],
+        "category": config.category,
         "symbol": symbol,
         "interval": str(interval)
     }
@@ -69,7 +120,7 @@ def get_historical_data(symbol=None, start=None, end=None, interval=None):
         else:
             # Fallback to direct HTTP request if pybit is not available
             url = "https://api.bybit.com/v5/market/kline"
-            res = requests.get(url, params=params).json()
+            res = parse_json(SESSION.get(url, params=params, timeout=10))
             
         data = res.get('result', {}).get('list', [])
         
@@ -77,25 +128,14 @@ def get_historical_data(symbol=None, start=None, end=None, interval=None):
             print(f"No data returned for {symbol}")
             return pd.DataFrame()
             
-        df = pd.DataFrame(data)
+        # Parse the string rows straight into a float matrix:
+        # [timestamp, open, high, low, close, volume, turnover]
+        # (older API versions omit turnover)
+        rows = np.array(data, dtype=np.float64)
+        columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'][:rows.shape[1]]
         
-        # Bybit kline endpoint returns data in different formats depending on the API version
-        if len(df.columns) >= 7:
-            df.columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover']
-        else:
-            # Adjust column names based on what's returned
-            default_columns = ['timestamp', 'open', 'high', 'low', 'close', 'volume']
-            df.columns = default_columns[:len(df.columns)]
-            
-        # Convert numeric columns
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_cols:
-            if col in df.columns:
-                df[col] = pd.to_numeric(df[col])
-                
-        # Convert timestamp
-        if 'timestamp' in df.columns:
-            df['timestamp'] = pd.to_datetime(df['timestamp'].astype(float), unit='ms')
+        df = pd.DataFrame(rows[:, 1:], columns=columns[1:])
+        df.insert(0, 'timestamp', pd.to_datetime(rows[:, 0].astype(np.int64), unit='ms'))
             
         return df
         
@@ -103,6 +143,11 @@ def get_historical_data(symbol=None, start=None, end=None, interval=None):
         print(f"Error fetching historical data: {str(e)}")
         return pd.DataFrame()
 
+_fetch_historical_data_cached = disk_cache(
+    ttl=HISTORY_CACHE_TTL, cache_if=lambda df: not df.empty
+)(_fetch_historical_data)
+
+@ttl_cache(ttl=PRICE_CACHE_TTL, cache_if=bool)
 def get_current_price(symbol=None):
     """
     Get the latest price for a symbol.
@@ -113,19 +158,19 @@ def get_current_price(symbol=None):
     Returns:
         Current price as float
     """
-    symbol = symbol or config["symbol"]
+    symbol = symbol or config.symbol
     
     try:
         if session:
             res = session.get_tickers(
-                category=config["category"],
+                category=config.category,
                 symbol=symbol
             )
         else:
             # Fallback to direct HTTP request
             url = "https://api.bybit.com/v5/market/tickers"
-            params = {"category": config["category"], "symbol": symbol}
-            res = requests.get(url, params=params).json()
+            params = {"category": config.category, "symbol": symbol}
+            res = parse_json(SESSION.get(url, params=params, timeout=10))
             
         items = res.get('result', {}).get('list', [])
         
@@ -137,6 +182,44 @@ def get_current_price(symbol=None):
         print(f"Error fetching current price: {str(e)}")
         return 0.0
 
+def get_all_prices():
+    """
+    Get the latest price of every symbol in one request.
+    
+    Bybit returns all tickers of a category when no symbol is given, so
+    callers needing many prices should use this instead of calling
+    get_current_price once per symbol. The snapshot is reused for
+    PRICES_CACHE_TTL seconds.
+    
+    Returns:
+        Dict mapping symbol to last price (empty on error)
+    """
+    now = time.time()
+    if _prices_cache["data"] and now - _prices_cache["at"] < PRICES_CACHE_TTL:
+        return _prices_cache["data"]
+        
+    try:
+        if session:
+            res = session.get_tickers(category=config.category)
+        else:
+            # Fallback to direct HTTP request
+            url = "https://api.bybit.com/v5/market/tickers"
+            params = {"category": config.category}
+            res = parse_json(SESSION.get(url, params=params, timeout=10))
+            
+        prices = {
+            item["symbol"]: float(item["lastPrice"])
+            for item in res.get('result', {}).get('list', [])
+            if item.get("lastPrice")
+        }
+        if prices:
+            _prices_cache.update(at=now, data=prices)
+        return prices
+        
+    except Exception as e:
+        print(f"Error fetching prices: {str(e)}")
+        return {}
+
 def get_symbols():
     """
     Get a list of available trading symbols.
@@ -144,21 +227,35 @@ def get_symbols():
     Returns:
         List of symbol strings
     """
-    url = "https://api.bybit.com/v5/market/instruments-info"
-    params = {"category": "linear", "status": "Trading", "limit": 1000}
-    
-    try:
-        response = requests.get(url, params=params)
-        data = response.json()
-        symbols = []
+    now = time.time()
+    if _symbols_cache["data"] and now - _symbols_cache["at"] < SYMBOLS_MEMORY_TTL:
+        return _symbols_cache["data"]
         
-        if data.get("retCode") == 0 and "result" in data:
-            for item in data["result"].get("list", []):
-                if item.get("quoteCoin") == "USDT":
-                    symbols.append(item["symbol"])
-                    
-        return symbols
+    try:
+        symbols = _fetch_symbols()
+        if symbols:
+            _symbols_cache.update(at=now, data=symbols)
+            return symbols
+        return _symbols_cache["data"] or symbols
         
     except Exception as e:
         print(f"Error fetching symbols: {str(e)}")
-        return ["BTCUSDT", "ETHUSDT", "SOLUSDT"]  # Return default symbols as fallback
+        # Serve the last good list if we have one, otherwise default symbols
+        return _symbols_cache["data"] or ["BTCUSDT", "ETHUSDT", "SOLUSDT"]
+
+@disk_cache(ttl=SYMBOLS_CACHE_TTL, cache_if=bool, stale_on_error=True)
+def _fetch_symbols():
+    """Request the USDT linear instruments list from Bybit."""
+    url = "https://api.bybit.com/v5/market/instruments-info"
+    params = {"category": "linear", "status": "Trading", "limit": 1000}
+    
+    response = SESSION.get(url, params=params, timeout=10)
+    data = parse_json(response)
+    
+    if data.get("retCode") != 0 or "result" not in data:
+        raise RuntimeError(f"Bybit API error: {data.get('retMsg', 'Unknown error')}")
+        
+    return [
+        item["symbol"] for item in data["result"].get("list", [])
+        if item.get("quoteCoin") == "USDT"
+    ]
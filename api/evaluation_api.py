@@ -3,8 +3,10 @@
 API endpoints for signal evaluation.
 """
 
+from collections import Counter
+
 from flask import Blueprint, jsonify, request
-from signal_evaluator import evaluate_all_signals, evaluate_signal
+from utils.signal_evaluator import evaluate_all_signals, evaluate_signal
 from utils.signal_storage import get_all_signals
 
 evaluation_api = Blueprint('evaluation_api', __name__)
@@ -61,21 +63,18 @@ def get_evaluation_status():
     try:
         signals = get_all_signals()
         
-        total_signals = len(signals)
-        evaluated_signals = len([s for s in signals if s.get("result")])
-        pending_signals = total_signals - evaluated_signals
+        # Count by result type in a single pass
+        results = Counter(s.get("result") or "PENDING" for s in signals)
         
-        # Count by result type
-        results = {}
-        for signal in signals:
-            result = signal.get("result", "PENDING")
-            results[result] = results.get(result, 0) + 1
+        total_signals = len(signals)
+        pending_signals = results.get("PENDING", 0)
+        evaluated_signals = total_signals - pending_signals
             
         return jsonify({
             "total_signals": total_signals,
             "evaluated_signals": evaluated_signals,
             "pending_signals": pending_signals,
-            "results_breakdown": results
+            "results_breakdown": dict(results)
         })
     except Exception as e:
         return jsonify({
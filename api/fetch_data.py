@@ -3,11 +3,61 @@
 Simplified data fetcher for monster signals API - Bybit Integration
 """
 
+import numpy as np
 import pandas as pd
-import requests
 from datetime import datetime
 import time
-from typing import Optional
+import zlib
+from types import MappingProxyType
+from typing import Dict, Optional
+
+from numba import jit
+
+from api.http_session import SESSION, parse_json
+from utils.caching import disk_cache, ttl_cache
+
+# Latest candles change every tick, so keep them only briefly on disk
+KLINE_CACHE_TTL = 60
+
+# Live prices are reused for this many seconds across duplicate lookups
+PRICE_CACHE_TTL = 0.5
+
+# In-memory kline cache: entries per symbol/interval/limit, and how long they
+# are reused. Kept short because the last (still open) candle keeps changing.
+KLINE_MEMORY_CACHE_SIZE = 256
+KLINE_MEMORY_CACHE_TTL = 15
+
+# Bybit V5 market endpoints
+BYBIT_KLINE_URL = "https://api.bybit.com/v5/market/kline"
+BYBIT_TICKERS_URL = "https://api.bybit.com/v5/market/tickers"
+
+# Timeframe aliases accepted by fetch_data, mapped to Bybit intervals
+INTERVAL_MAP = MappingProxyType({
+    '1': '1',    # 1 minute
+    '3': '3',    # 3 minutes
+    '5': '5',    # 5 minutes
+    '15': '15',  # 15 minutes
+    '30': '30',  # 30 minutes
+    '60': '60',  # 1 hour
+    '240': '240', # 4 hours
+    'D': 'D',    # 1 day
+    '15m': '15', # Alternative format
+    '1h': '60'   # Alternative format
+})
+
+# Base price based on symbol - realistic current prices for mock data
+MOCK_BASE_PRICES = MappingProxyType({
+    'BTCUSDT': 96500,   # Current BTC price range
+    'ETHUSDT': 3350,    # Current ETH price range
+    'SOLUSDT': 185,     # Current SOL price range
+    'DOGEUSDT': 0.32,   # Current DOGE price range
+    'ADAUSDT': 0.88,    # Current ADA price range
+    'BNBUSDT': 665,     # Current BNB price range
+    'XRPUSDT': 2.15,    # Current XRP price range
+    'MATICUSDT': 0.42,  # Current MATIC price range
+    'LINKUSDT': 22.5,   # Current LINK price range
+    'AVAXUSDT': 38.2    # Current AVAX price range
+})
 
 def fetch_data(symbol: str, timeframe: str, limit: int = 200) -> pd.DataFrame:
     """
@@ -21,76 +71,101 @@ def fetch_data(symbol: str, timeframe: str, limit: int = 200) -> pd.DataFrame:
     Returns:
         DataFrame with OHLCV data
     """
+    return pd.DataFrame(fetch_data_np(symbol, timeframe, limit))
+
+def fetch_data_np(symbol: str, timeframe: str, limit: int = 200) -> Dict[str, np.ndarray]:
+    """
+    Fetch candlestick data from Bybit as NumPy columns.
+    
+    Same data as fetch_data, without building a DataFrame, for callers
+    that only need the arrays. Results are memoized for a few seconds, so
+    the arrays are shared and must not be modified.
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTCUSDT')
+        timeframe: Timeframe (e.g., '15', '60' for minutes)
+        limit: Number of candles to fetch
+        
+    Returns:
+        Dict mapping timestamp/open/high/low/close/volume to arrays, oldest first
+    """
     try:
         # Convert timeframe to Bybit format
-        interval_map = {
-            '1': '1',    # 1 minute
-            '3': '3',    # 3 minutes
-            '5': '5',    # 5 minutes
-            '15': '15',  # 15 minutes
-            '30': '30',  # 30 minutes
-            '60': '60',  # 1 hour
-            '240': '240', # 4 hours
-            'D': 'D',    # 1 day
-            '15m': '15', # Alternative format
-            '1h': '60'   # Alternative format
-        }
-        
-        interval = interval_map.get(timeframe, '15')
-        
-        # Bybit V5 API endpoint for kline data
-        url = "https://api.bybit.com/v5/market/kline"
-        
-        params = {
-            'category': 'linear',
-            'symbol': symbol,
-            'interval': interval,
-            'limit': limit
-        }
+        interval = INTERVAL_MAP.get(timeframe, '15')
         
         print(f"Fetching data from Bybit: {symbol} {timeframe}")
         
-        response = requests.get(url, params=params, timeout=10)
-        response.raise_for_status()
-        
-        data = response.json()
-        
-        if data.get('retCode') != 0:
-            print(f"Bybit API error: {data.get('retMsg', 'Unknown error')}")
-            return generate_mock_data(symbol, limit)
-        
-        klines = data.get('result', {}).get('list', [])
-        
-        if not klines:
-            print(f"No data returned for {symbol} {timeframe}")
-            return generate_mock_data(symbol, limit)
-        
-        # Convert to DataFrame
-        df = pd.DataFrame(klines, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume', 'turnover'
-        ])
-        
-        # Convert numeric columns
-        numeric_cols = ['open', 'high', 'low', 'close', 'volume', 'turnover']
-        for col in numeric_cols:
-            df[col] = pd.to_numeric(df[col])
-        
-        # Convert timestamp to datetime (Bybit returns milliseconds)
-        df['timestamp'] = pd.to_datetime(df['timestamp'].astype(int), unit='ms')
-        
-        # Sort by timestamp (Bybit returns newest first, we want oldest first)
-        df = df.sort_values('timestamp').reset_index(drop=True)
-        
-        # Keep only essential columns
-        df = df[['timestamp', 'open', 'high', 'low', 'close', 'volume']]
+        columns = _fetch_klines_recent(symbol, interval, limit)
         
-        print(f"Successfully fetched {len(df)} candles for {symbol} {timeframe}")
-        return df
+        if columns is not None:
+            print(f"Successfully fetched {len(columns['close'])} candles for {symbol} {timeframe}")
+            return columns
         
     except Exception as e:
         print(f"Error fetching data for {symbol} {timeframe}: {str(e)}")
-        return generate_mock_data(symbol, limit)
+        
+    return generate_mock_columns(symbol, limit)
+
+@ttl_cache(ttl=KLINE_MEMORY_CACHE_TTL, maxsize=KLINE_MEMORY_CACHE_SIZE)
+def _fetch_klines_recent(symbol: str, interval: str, limit: int) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Memoize _fetch_klines in memory for KLINE_MEMORY_CACHE_TTL seconds.
+    
+    "No data" results (None) are memoized too, so empty instruments are not
+    re-queried on every call. API errors raise and are never cached.
+    """
+    return _fetch_klines(symbol, interval, limit)
 
+@disk_cache(ttl=KLINE_CACHE_TTL, cache_if=lambda columns: columns is not None)
+def _fetch_klines(symbol: str, interval: str, limit: int) -> Optional[Dict[str, np.ndarray]]:
+    """
+    Request kline data from the Bybit V5 API.
+    
+    Returns:
+        Dict of OHLCV arrays, or None when Bybit returned no data
+        
+    Raises:
+        RuntimeError: If Bybit answered with an error (e.g. rate limit)
+    """
+    params = {
+        'category': 'linear',
+        'symbol': symbol,
+        'interval': interval,
+        'limit': limit
+    }
+    
+    response = SESSION.get(BYBIT_KLINE_URL, params=params, timeout=10)
+    response.raise_for_status()
+    
+    data = parse_json(response)
+    
+    if data.get('retCode') != 0:
+        raise RuntimeError(f"Bybit API error: {data.get('retMsg', 'Unknown error')}")
+    
+    klines = data.get('result', {}).get('list', [])
+    
+    if not klines:
+        print(f"No data returned for {symbol} {interval}")
+        return None
+    
+    # Parse the string rows straight into a float matrix:
+    # [timestamp, open, high, low, close, volume, turnover]
+    arr = np.array(klines, dtype=np.float64)
+    
+    # Sort by timestamp (Bybit returns newest first, we want oldest first)
+    arr = arr[np.argsort(arr[:, 0], kind='stable')]
+    
+    # Keep only the essential columns (Bybit timestamps are milliseconds)
+    return {
+        'timestamp': arr[:, 0].astype(np.int64).astype('datetime64[ms]'),
+        'open': arr[:, 1],
+        'high': arr[:, 2],
+        'low': arr[:, 3],
+        'close': arr[:, 4],
+        'volume': arr[:, 5]
+    }
+
+@ttl_cache(ttl=PRICE_CACHE_TTL, cache_if=bool)
 def get_current_price(symbol: str) -> float:
     """
     Get current price from Bybit ticker API
@@ -102,16 +177,15 @@ def get_current_price(symbol: str) -> float:
         Current price as float
     """
     try:
-        url = "https://api.bybit.com/v5/market/tickers"
         params = {
             'category': 'linear',
             'symbol': symbol
         }
         
-        response = requests.get(url, params=params, timeout=5)
+        response = SESSION.get(BYBIT_TICKERS_URL, params=params, timeout=5)
         response.raise_for_status()
         
-        data = response.json()
+        data = parse_json(response)
         
         if data.get('retCode') != 0:
             print(f"Error getting price for {symbol}: {data.get('retMsg')}")
@@ -134,50 +208,63 @@ def generate_mock_data(symbol: str, limit: int = 200) -> pd.DataFrame:
     """
     Generate mock OHLCV data for testing when API fails
     """
-    import numpy as np
-    
-    # Base price based on symbol - realistic current prices
-    base_prices = {
-        'BTCUSDT': 96500,   # Current BTC price range
-        'ETHUSDT': 3350,    # Current ETH price range
-        'SOLUSDT': 185,     # Current SOL price range
-        'DOGEUSDT': 0.32,   # Current DOGE price range
-        'ADAUSDT': 0.88,    # Current ADA price range
-        'BNBUSDT': 665,     # Current BNB price range
-        'XRPUSDT': 2.15,    # Current XRP price range
-        'MATICUSDT': 0.42,  # Current MATIC price range
-        'LINKUSDT': 22.5,   # Current LINK price range
-        'AVAXUSDT': 38.2    # Current AVAX price range
+    return pd.DataFrame(generate_mock_columns(symbol, limit))
+
+def generate_mock_columns(symbol: str, limit: int = 200) -> Dict[str, np.ndarray]:
+    """
+    Generate mock OHLCV data as NumPy columns (see generate_mock_data)
+    """
+    base_price = MOCK_BASE_PRICES.get(symbol, 100)
+    
+    # Generate realistic price movement
+    dates = pd.date_range(end=datetime.now(), periods=limit, freq='15min')
+    
+    # Random walk with trend and realistic volatility.
+    # Local generator seeded per symbol: stable across runs (unlike hash())
+    # and safe to use from several threads without touching the global seed
+    rng = np.random.default_rng(zlib.crc32(symbol.encode()))
+    returns = rng.standard_normal(limit) * 0.01  # 1% volatility
+    volatility = rng.uniform(0.2, 1.5, limit) / 100  # 0.2% to 1.5% intra-candle volatility
+    volumes = rng.uniform(1000, 50000, limit)  # Realistic volume
+    
+    open_prices, high_prices, low_prices, close_prices = _mock_walk(float(base_price), returns, volatility)
+    
+    print(f"Generated mock data for {symbol}: {limit} candles")
+    return {
+        'timestamp': dates.to_numpy(),
+        'open': open_prices,
+        'high': high_prices,
+        'low': low_prices,
+        'close': close_prices,
+        'volume': volumes
     }
+
+@jit(nopython=True, cache=True)
+def _mock_walk(base_price, returns, volatility):
+    """
+    Expand a log-return random walk into OHLC columns in a single pass.
     
-    base_price = base_prices.get(symbol, 100)
+    Args:
+        base_price: Starting price
+        returns: Per-candle log returns
+        volatility: Per-candle intra-candle range as a fraction of close
+        
+    Returns:
+        Tuple of (open, high, low, close) arrays
+    """
+    n = len(returns)
+    open_prices = np.empty(n)
+    high_prices = np.empty(n)
+    low_prices = np.empty(n)
+    close_prices = np.empty(n)
     
-    # Generate realistic price movement
-    dates = pd.date_range(end=datetime.now(), periods=limit, freq='15T')
-    
-    # Random walk with trend and realistic volatility
-    np.random.seed(hash(symbol) % 2**32)  # Consistent seed per symbol
-    returns = np.random.normal(0, 0.01, limit)  # 1% volatility
-    prices = base_price * np.exp(np.cumsum(returns))
-    
-    data = []
-    for i, (date, price) in enumerate(zip(dates, prices)):
-        volatility = np.random.uniform(0.2, 1.5) / 100  # 0.2% to 1.5% intra-candle volatility
-        high = price * (1 + volatility)
-        low = price * (1 - volatility)
-        open_price = prices[i-1] if i > 0 else price
-        close_price = price
-        volume = np.random.uniform(1000, 50000)  # Realistic volume
-        
-        data.append({
-            'timestamp': date,
-            'open': open_price,
-            'high': high,
-            'low': low,
-            'close': close_price,
-            'volume': volume
-        })
-    
-    df = pd.DataFrame(data)
-    print(f"Generated mock data for {symbol}: {len(df)} candles")
-    return df
+    log_price = np.log(base_price)
+    for i in range(n):
+        log_price += returns[i]
+        close = np.exp(log_price)
+        open_prices[i] = close_prices[i - 1] if i > 0 else close
+        high_prices[i] = close * (1 + volatility[i])
+        low_prices[i] = close * (1 - volatility[i])
+        close_prices[i] = close
+        
+    return open_prices, high_prices, low_prices, close_prices
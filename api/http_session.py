@@ -0,0 +1,48 @@
+"""
+Shared HTTP session for direct exchange REST calls.
+
+A single pooled requests.Session keeps TCP/TLS connections alive across
+calls instead of opening a new connection for every request.
+"""
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+def create_session() -> requests.Session:
+    """
+    Create a requests session with connection pooling and retries.
+
+    Returns:
+        Configured requests.Session
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=10,
+        pool_maxsize=20,
+        max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(502, 503, 504))
+    )
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+def parse_json(response: requests.Response):
+    """
+    Decode a JSON response body, using orjson when it is installed.
+
+    Args:
+        response: HTTP response with a JSON body
+
+    Returns:
+        Decoded JSON object
+    """
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+SESSION = create_session()
@@ -6,13 +6,115 @@ This module provides a Flask Blueprint with routes for retrieving
 hybrid trading signals data stored in CSV format.
 """
 
-from flask import Blueprint, jsonify
+from flask import Blueprint, Response, jsonify
 import pandas as pd
 from pathlib import Path
 import os
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    import pyarrow.csv as pacsv
+except ImportError:
+    pa = None
+    pc = None
+    pacsv = None
+
 hybrid_signals_api = Blueprint('hybrid_signals_api', __name__)
 
+# Last parsed CSV, reused until the file changes:
+# (path, mtime_ns, size) -> (record count, orjson bytes or records list)
+_payload_cache = {"key": None, "count": 0, "payload": None}
+
+def frame_to_records(df):
+    """
+    Convert a DataFrame to a list of row dicts.
+    
+    Equivalent to df.to_dict(orient="records"), but converts each column to
+    native Python values once (Series.tolist) and zips the columns, instead
+    of boxing every cell individually.
+    
+    Args:
+        df: DataFrame to convert
+        
+    Returns:
+        List of dicts, one per row
+    """
+    columns = list(df.columns)
+    values = [df[column].tolist() for column in columns]
+    return [dict(zip(columns, row)) for row in zip(*values)]
+
+def read_sorted_records(file):
+    """
+    Read the hybrid signals CSV as records sorted by timestamp, newest first.
+    
+    Uses PyArrow's multithreaded CSV reader and sorts the Arrow table
+    directly when pyarrow is installed, otherwise pandas. The generator
+    appends signals chronologically, so when the rows are already in
+    ascending order they are just reversed instead of sorted.
+    
+    Args:
+        file: Path of the CSV file
+        
+    Returns:
+        List of record dicts
+    """
+    if pacsv is None:
+        df = pd.read_csv(file)
+        timestamps = df['timestamp']
+        if timestamps.is_monotonic_increasing and not timestamps.hasnans:
+            df = df.iloc[::-1]
+        else:
+            df = df.sort_values(by='timestamp', ascending=False)
+        return frame_to_records(df)
+        
+    table = pacsv.read_csv(
+        file,
+        read_options=pacsv.ReadOptions(use_threads=True),
+        # Keep timestamps as the ISO strings stored in the file
+        convert_options=pacsv.ConvertOptions(column_types={'timestamp': pa.string()})
+    )
+    timestamps = table.column('timestamp')
+    in_order = timestamps.null_count == 0 and pc.all(
+        pc.greater_equal(timestamps.slice(1), timestamps.slice(0, len(timestamps) - 1))
+    ).as_py() is not False  # None when there are fewer than two rows
+    if in_order:
+        table = table.take(pa.array(range(table.num_rows - 1, -1, -1)))
+    else:
+        table = table.sort_by([('timestamp', 'descending')])
+    return table.to_pylist()
+
+def load_payload(file):
+    """
+    Get the hybrid signals JSON payload, reparsing only when the file changed.
+    
+    The parsed, sorted records are pre-encoded with orjson (or kept as a
+    list for jsonify when orjson is missing) and cached against the file's
+    path, mtime and size.
+    
+    Args:
+        file: Path of the CSV file
+        
+    Returns:
+        Tuple of (record count, payload)
+    """
+    stat = os.stat(file)
+    key = (str(file), stat.st_mtime_ns, stat.st_size)
+    if _payload_cache["key"] == key:
+        return _payload_cache["count"], _payload_cache["payload"]
+        
+    print(f"Reading hybrid signals from: {file}")
+    # Records sorted by timestamp descending
+    records = read_sorted_records(file)
+    payload = records if orjson is None else orjson.dumps(records)
+    _payload_cache.update(key=key, count=len(records), payload=payload)
+    return len(records), payload
+
 @hybrid_signals_api.route("/api/signals/history/hybrid", methods=["GET"])
 def get_hybrid_signals():
     """
@@ -41,17 +143,11 @@ def get_hybrid_signals():
         return jsonify({"message": "Nenhum sinal híbrido encontrado"}), 404
 
     try:
-        print(f"Reading hybrid signals from: {file}")
-        df = pd.read_csv(file)
-        print(f"Found {len(df)} hybrid signals")
-            
-        # Sort by timestamp descending
-        df = df.sort_values(by='timestamp', ascending=False)
-        
-        # Convert to dict records
-        records = df.to_dict(orient="records")
-        print(f"Returning {len(records)} hybrid signals")
-        return jsonify(records)
+        count, payload = load_payload(file)
+        print(f"Returning {count} hybrid signals")
+        if orjson is None:
+            return jsonify(payload)
+        return Response(payload, mimetype="application/json")
     except Exception as e:
         print(f"Error processing hybrid signals: {str(e)}")
         return jsonify({"error": f"Error processing hybrid signals: {str(e)}"}), 500
@@ -3,20 +3,87 @@
 Market Data Service - Real-time price fetching from Bybit
 """
 
-import requests
 import json
+import threading
+import time
 from typing import Dict, List, Optional
 from datetime import datetime
 
+from api.http_session import SESSION, parse_json
+
+# How long a full-market tickers snapshot is reused, in seconds
+TICKER_CACHE_TTL = 1.5
+
+class TickerCache:
+    """
+    Short-lived cache of all Bybit linear tickers.
+    
+    Bybit's /market/tickers returns every linear ticker in one response, so
+    a single snapshot serves any number of per-symbol lookups made within
+    the TTL instead of one HTTP round trip per symbol.
+    """
+    
+    def __init__(self, url: str, ttl: float = TICKER_CACHE_TTL):
+        self.url = url
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._fetched_at = 0.0
+        self._tickers: Dict[str, dict] = {}
+        self._prices: Dict[str, float] = {}
+    
+    def _refresh(self):
+        """Fetch the full tickers list and rebuild both lookups in one pass."""
+        response = SESSION.get(self.url, params={'category': 'linear'}, timeout=10)
+        response.raise_for_status()
+        
+        data = parse_json(response)
+        
+        if data.get('retCode') != 0:
+            raise RuntimeError(f"Bybit API error: {data.get('retMsg')}")
+        
+        tickers = {}
+        prices = {}
+        for ticker in data.get('result', {}).get('list', []):
+            symbol = ticker.get('symbol')
+            tickers[symbol] = ticker
+            try:
+                prices[symbol] = float(ticker.get('lastPrice', 0))
+            except (ValueError, TypeError):
+                continue
+        
+        self._tickers, self._prices = tickers, prices
+        self._fetched_at = time.monotonic()
+    
+    def get_tickers(self) -> Dict[str, dict]:
+        """
+        Get the raw ticker of every symbol, refreshing when stale.
+        
+        Returns:
+            Dictionary mapping symbol to its Bybit ticker
+        """
+        with self._lock:
+            if time.monotonic() - self._fetched_at >= self.ttl:
+                self._refresh()
+            return self._tickers
+    
+    def get_all(self) -> Dict[str, float]:
+        """
+        Get the last price of every symbol, refreshing when stale.
+        
+        Returns:
+            Dictionary mapping symbol to last price
+        """
+        self.get_tickers()
+        return self._prices
+
 class MarketDataService:
     """Service for fetching real-time market data from Bybit"""
     
     def __init__(self):
         self.base_url = "https://api.bybit.com/v5"
-        self.session = requests.Session()
-        self.session.headers.update({
-            'Content-Type': 'application/json'
-        })
+        # Shared pooled session: keeps connections to Bybit alive across calls
+        self.session = SESSION
+        self.ticker_cache = TickerCache(f"{self.base_url}/market/tickers")
     
     def get_current_prices(self, symbols: List[str]) -> Dict[str, float]:
         """
@@ -24,38 +91,17 @@ class MarketDataService:
         
         Args:
             symbols: List of trading pairs (e.g., ['BTCUSDT', 'ETHUSDT'])
-            
+        
         Returns:
             Dictionary mapping symbol to current price
         """
         try:
-            url = f"{self.base_url}/market/tickers"
-            params = {'category': 'linear'}
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('retCode') != 0:
-                print(f"Bybit API error: {data.get('retMsg')}")
-                return {}
-            
-            prices = {}
-            tickers = data.get('result', {}).get('list', [])
-            
-            for ticker in tickers:
-                symbol = ticker.get('symbol')
-                if symbol in symbols:
-                    try:
-                        price = float(ticker.get('lastPrice', 0))
-                        prices[symbol] = price
-                    except (ValueError, TypeError):
-                        continue
+            all_prices = self.ticker_cache.get_all()
+            prices = {symbol: all_prices[symbol] for symbol in symbols if symbol in all_prices}
             
             print(f"Fetched prices for {len(prices)} symbols")
             return prices
-            
+        
         except Exception as e:
             print(f"Error fetching current prices: {str(e)}")
             return {}
@@ -66,32 +112,13 @@ class MarketDataService:
         
         Args:
             symbol: Trading pair symbol (e.g., 'BTCUSDT')
-            
+        
         Returns:
             Current price or None if error
         """
         try:
-            url = f"{self.base_url}/market/tickers"
-            params = {
-                'category': 'linear',
-                'symbol': symbol
-            }
-            
-            response = self.session.get(url, params=params, timeout=5)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('retCode') != 0:
-                return None
-            
-            tickers = data.get('result', {}).get('list', [])
-            
-            if tickers:
-                return float(tickers[0].get('lastPrice', 0))
-            
-            return None
-            
+            return self.ticker_cache.get_all().get(symbol)
+        
         except Exception as e:
             print(f"Error fetching price for {symbol}: {str(e)}")
             return None
@@ -102,47 +129,37 @@ class MarketDataService:
         
         Args:
             symbols: List of trading pairs
-            
+        
         Returns:
             Market summary data
         """
         try:
-            url = f"{self.base_url}/market/tickers"
-            params = {'category': 'linear'}
-            
-            response = self.session.get(url, params=params, timeout=10)
-            response.raise_for_status()
-            
-            data = response.json()
-            
-            if data.get('retCode') != 0:
-                return {}
+            tickers = self.ticker_cache.get_tickers()
             
             summary = {
                 'timestamp': datetime.utcnow().isoformat(),
                 'symbols': {}
             }
             
-            tickers = data.get('result', {}).get('list', [])
-            
-            for ticker in tickers:
-                symbol = ticker.get('symbol')
-                if symbol in symbols:
-                    try:
-                        summary['symbols'][symbol] = {
-                            'price': float(ticker.get('lastPrice', 0)),
-                            'volume24h': float(ticker.get('volume24h', 0)),
-                            'price_change_24h': float(ticker.get('price24hPcnt', 0)) * 100,
-                            'high24h': float(ticker.get('highPrice24h', 0)),
-                            'low24h': float(ticker.get('lowPrice24h', 0)),
-                            'bid': float(ticker.get('bid1Price', 0)),
-                            'ask': float(ticker.get('ask1Price', 0))
-                        }
-                    except (ValueError, TypeError):
-                        continue
+            for symbol in symbols:
+                ticker = tickers.get(symbol)
+                if ticker is None:
+                    continue
+                try:
+                    summary['symbols'][symbol] = {
+                        'price': float(ticker.get('lastPrice', 0)),
+                        'volume24h': float(ticker.get('volume24h', 0)),
+                        'price_change_24h': float(ticker.get('price24hPcnt', 0)) * 100,
+                        'high24h': float(ticker.get('highPrice24h', 0)),
+                        'low24h': float(ticker.get('lowPrice24h', 0)),
+                        'bid': float(ticker.get('bid1Price', 0)),
+                        'ask': float(ticker.get('ask1Price', 0))
+                    }
+                except (ValueError, TypeError):
+                    continue
             
             return summary
-            
+        
         except Exception as e:
             print(f"Error fetching market summary: {str(e)}")
             return {}
@@ -6,12 +6,15 @@ Monster Signals API - Enhanced with real Bybit market data
 from flask import Blueprint, jsonify, request
 import pandas as pd
 import numpy as np
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
 import logging
 import traceback
 
+from numba import jit
+
 # Import our data services
-from api.fetch_data import fetch_data, get_current_price
+from api.fetch_data import fetch_data, fetch_data_np
 from api.market_data_service import market_data_service
 
 # Create blueprint for monster signals
@@ -19,56 +22,243 @@ monster_signals_api = Blueprint('monster_signals', __name__)
 
 logger = logging.getLogger("MonsterSignalsAPI")
 
+# Symbols analyzed in parallel by generate_monster_signals
+MONSTER_WORKERS = 10
+
+# 15m candles fetched per symbol. EMA 200 (alpha = 2/201) still weighs its
+# seed candle at ~8% after 250 bars, so trimming history shifts the trend
+# line noticeably: 220 bars already moves it by more than 1e-4 relative.
+MONSTER_CANDLES = 250
+
+# EMA span, RSI, ATR, volume mean and VWAP windows of _last_bar_indicators.
+# Always passed explicitly: Numba dispatch of calls that omit default
+# arguments costs ~100x the 250-bar kernel itself.
+INDICATOR_WINDOWS = (200, 14, 14, 20, 50)
+
 # ============================================================================
 # SIMPLIFIED PROFESSIONAL INDICATORS (EMA 200, ATR, Volume, RSI)
 # ============================================================================
 
+# Full-series reference implementations. Signals use the Numba kernels below;
+# these are kept only so tests can check the kernels against them.
+
 def calculate_ema(data, window):
-    """Calculate Exponential Moving Average"""
+    """Calculate Exponential Moving Average (test reference for _ema_last)"""
     return data.ewm(span=window, adjust=False).mean()
 
 def calculate_rsi(data, window=14):
-    """Calculate RSI indicator for divergences and extremes"""
-    delta = data.diff()
-    gain = (delta.where(delta > 0, 0)).rolling(window=window).mean()
-    loss = (-delta.where(delta < 0, 0)).rolling(window=window).mean()
+    """Calculate RSI with Wilder/RMA smoothing, as TradingView (test reference)"""
+    delta = data.diff().to_numpy(dtype=np.float64)
+    
+    # Branchless split into gains and losses, clipping the losses in place
+    gain = np.maximum(delta, 0.0)
+    loss = np.negative(delta)
+    np.maximum(loss, 0.0, out=loss)
+    
+    gain = pd.Series(gain, index=data.index).ewm(alpha=1 / window, adjust=False).mean()
+    loss = pd.Series(loss, index=data.index).ewm(alpha=1 / window, adjust=False).mean()
     rs = gain / loss
     rsi = 100 - (100 / (1 + rs))
     return rsi
 
 def calculate_atr(high, low, close, window=14):
-    """Calculate Average True Range for dynamic risk management"""
-    tr1 = high - low
-    tr2 = abs(high - close.shift())
-    tr3 = abs(low - close.shift())
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    atr = tr.rolling(window=window).mean()
+    """Calculate Average True Range with Wilder smoothing, as TradingView (test reference)"""
+    h = high.to_numpy(dtype=np.float64)
+    l = low.to_numpy(dtype=np.float64)
+    c = close.to_numpy(dtype=np.float64)
+    
+    # Previous close; the first candle uses its own close, so its TR is high - low
+    prev_close = np.empty_like(c)
+    prev_close[:1] = c[:1]
+    prev_close[1:] = c[:-1]
+    
+    # True range built in place in two scratch buffers, without stacking a 3 x N array
+    tr = np.subtract(h, l)
+    scratch = np.subtract(h, prev_close)
+    np.maximum(tr, np.abs(scratch, out=scratch), out=tr)
+    np.subtract(l, prev_close, out=scratch)
+    np.maximum(tr, np.abs(scratch, out=scratch), out=tr)
+    atr = pd.Series(tr, index=close.index).ewm(alpha=1 / window, adjust=False).mean()
     return atr
 
-def get_ema200_direction(df):
-    """Simplified trend detection using only EMA 200"""
-    if len(df) < 200:
-        return None
+@jit(nopython=True, nogil=True, cache=True)
+def _ema_last(close, span):
+    """Last value of calculate_ema (adjust=False), without the full series."""
+    alpha = 2.0 / (span + 1.0)
+    ema = close[0]
+    for i in range(1, len(close)):
+        ema = alpha * close[i] + (1.0 - alpha) * ema
+    return ema
+
+@jit(nopython=True, nogil=True, cache=True)
+def _last_bar_indicators(close, high, low, volume, ema_span=200, rsi_window=14,
+                         atr_window=14, volume_window=20, vwap_window=50):
+    """
+    Compute the last-bar values of the monster signal indicators in one pass.
     
-    ema_200 = calculate_ema(df['close'], 200).iloc[-1]
-    current_price = df['close'].iloc[-1]
+    Matches calculate_ema (adjust=False), calculate_rsi, calculate_atr and the
+    rolling volume/VWAP means, evaluated at the final candle only. Expects
+    more candles than the largest window.
     
-    if current_price > ema_200:
-        return "BUY"
-    elif current_price < ema_200:
-        return "SELL"
+    Returns:
+        Tuple of (ema, rsi, atr, volume_avg, vwap); rsi/vwap are NaN when undefined
+    """
+    n = len(close)
+    
+    ema = _ema_last(close, ema_span)
+        
+    # Wilder (RMA) smoothed gains and losses, seeded with the first move
+    gain = max(close[1] - close[0], 0.0)
+    loss = max(close[0] - close[1], 0.0)
+    for i in range(2, n):
+        delta = close[i] - close[i - 1]
+        gain += (max(delta, 0.0) - gain) / rsi_window
+        loss += (max(-delta, 0.0) - loss) / rsi_window
+    if loss > 0:
+        rsi = 100.0 - 100.0 / (1.0 + gain / loss)
+    elif gain > 0:
+        rsi = 100.0
+    else:
+        rsi = np.nan
+        
+    # Wilder (RMA) smoothing of the true range over the whole series
+    atr = high[0] - low[0]
+    for i in range(1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        atr += (tr - atr) / atr_window
+    
+    # Window sums accumulated in float64 whatever the input precision
+    volume_avg = 0.0
+    for i in range(n - volume_window, n):
+        volume_avg += volume[i]
+    volume_avg /= volume_window
     
-    return None
+    volume_sum = 0.0
+    price_volume_sum = 0.0
+    for i in range(n - vwap_window, n):
+        volume_sum += volume[i]
+        price_volume_sum += float(close[i]) * volume[i]
+    if volume_sum != 0:
+        vwap = price_volume_sum / volume_sum
+    else:
+        vwap = np.nan
+        
+    return ema, rsi, atr, volume_avg, vwap
 
-def volume_spike_confirmation(df, multiplier=1.5):
-    """Volume must be 150% above average (professional standard)"""
-    if len(df) < 20:
-        return False
+@jit(nopython=True, nogil=True, cache=True)
+def _batch_last_bar_indicators(closes, highs, lows, volumes, lengths):
+    """
+    _last_bar_indicators for many symbols in one compiled call.
+    
+    Deliberately serial: a batch is ~10 x 250 candles, and a parallel kernel
+    would abort the process under Numba's workqueue threading layer when
+    Flask threads call it concurrently.
+    
+    Rows of the (N, max length) matrices are left-aligned; lengths holds
+    each symbol's candle count.
     
-    current_vol = df['volume'].iloc[-1]
-    avg_vol = df['volume'].rolling(20).mean().iloc[-1]
+    Returns:
+        (N, 5) array of ema, rsi, atr, volume_avg, vwap per symbol
+    """
+    out = np.empty((closes.shape[0], 5))
+    for s in range(closes.shape[0]):
+        n = lengths[s]
+        ema, rsi, atr, volume_avg, vwap = _last_bar_indicators(
+            closes[s, :n], highs[s, :n], lows[s, :n], volumes[s, :n]
+        )
+        out[s, 0] = ema
+        out[s, 1] = rsi
+        out[s, 2] = atr
+        out[s, 3] = volume_avg
+        out[s, 4] = vwap
+    return out
+
+def _to_arrays(candles):
+    """
+    OHLCV columns of a DataFrame or fetch_data_np dict as float32 arrays.
     
-    return current_vol > avg_vol * multiplier
+    Called once at the edge so the filters below only index NumPy arrays.
+    Single precision is plenty for the indicator thresholds and halves the
+    data the kernels read; they still accumulate in float64. Prices quoted
+    in signals come from the original float64 closes. The timestamp column,
+    when present, is kept as is.
+    """
+    arrays = {
+        name: np.asarray(candles[name], dtype=np.float32)
+        for name in ('open', 'high', 'low', 'close', 'volume')
+    }
+    if 'timestamp' in candles:
+        arrays['timestamp'] = np.asarray(candles['timestamp'])
+    return arrays
+
+def last_bar_indicators(arrays):
+    """
+    Last-bar EMA 200, RSI, ATR, 20-bar volume mean and 50-bar VWAP.
+    
+    Args:
+        arrays: OHLCV arrays (see _to_arrays) with at least 200 candles
+        
+    Returns:
+        Dict with ema_200, rsi, atr, volume_avg and vwap scalars
+    """
+    ema_200, rsi, atr, volume_avg, vwap = _last_bar_indicators(
+        arrays['close'], arrays['high'], arrays['low'], arrays['volume'], *INDICATOR_WINDOWS
+    )
+    return {'ema_200': ema_200, 'rsi': rsi, 'atr': atr, 'volume_avg': volume_avg, 'vwap': vwap}
+
+def batch_last_bar_indicators(arrays_list):
+    """
+    last_bar_indicators for a batch of symbols in one kernel call.
+    
+    Symbols with fewer than 200 candles get None.
+    
+    Args:
+        arrays_list: OHLCV arrays (see _to_arrays) of each symbol
+        
+    Returns:
+        List of indicator dicts (or None), aligned with arrays_list
+    """
+    results = [None] * len(arrays_list)
+    ready = [i for i, arrays in enumerate(arrays_list) if len(arrays['close']) >= 200]
+    if not ready:
+        return results
+    
+    lengths = np.array([len(arrays_list[i]['close']) for i in ready], dtype=np.int64)
+    matrices = {}
+    for name in ('close', 'high', 'low', 'volume'):
+        matrix = np.zeros((len(ready), lengths.max()), dtype=np.float32)
+        for row, i in enumerate(ready):
+            matrix[row, :lengths[row]] = arrays_list[i][name]
+        matrices[name] = matrix
+    
+    values = _batch_last_bar_indicators(
+        matrices['close'], matrices['high'], matrices['low'], matrices['volume'], lengths
+    )
+    for row, i in enumerate(ready):
+        results[i] = dict(zip(('ema_200', 'rsi', 'atr', 'volume_avg', 'vwap'), values[row].tolist()))
+    return results
+
+def get_ema200_direction(arrays, ema_200=None):
+    """
+    Simplified trend detection using only EMA 200
+    
+    Pass ema_200 when it is already known (e.g. from last_bar_indicators) to
+    skip the EMA pass. Returns (direction, ema_200); direction is None when
+    undefined.
+    """
+    if len(arrays['close']) < 200:
+        return None, np.nan
+    
+    if ema_200 is None:
+        ema_200 = _ema_last(arrays['close'], 200)
+    current_price = arrays['close'][-1]
+    
+    if current_price > ema_200:
+        return "BUY", ema_200
+    elif current_price < ema_200:
+        return "SELL", ema_200
+    
+    return None, ema_200
 
 def rsi_extremes_filter(rsi, direction):
     """RSI filter for extremes and divergences (professional approach)"""
@@ -78,92 +268,161 @@ def rsi_extremes_filter(rsi, direction):
         return True
     return False
 
-def volume_profile_confirmation(df, window=50):
-    """Volume Profile POC breakout confirmation"""
-    if len(df) < window:
-        return False
-    
-    # Calculate volume-weighted average price (VWAP) as POC approximation
-    volume_sum = df['volume'].rolling(window).sum().iloc[-1]
-    if volume_sum == 0:
-        return False
-    
-    vwap = (df['close'] * df['volume']).rolling(window).sum().iloc[-1] / volume_sum
-    current_price = df['close'].iloc[-1]
-    
-    # Check for POC breakout (0.2% threshold)
-    poc_break = abs(current_price - vwap) / vwap > 0.002
+# Technical confirmations every signal has passed: EMA 200, RSI, volume spike, POC breakout
+TECHNICAL_CONFIRMATIONS = 4
+
+ANALYSIS_TEMPLATE = """Análise Técnica PROFISSIONAL - Sistema Simplificado:
+
+📊 DIREÇÃO PRINCIPAL:
+• EMA 200: Tendência {direction} confirmada
+• Preço {price_side} da média móvel de longo prazo
+
+🎯 INDICADORES EXTREMOS:
+• RSI: {rsi:.2f} {rsi_zone}
+• ATR: {atr:.6f} (Volatilidade para gestão de risco)
+
+📈 CONFIRMAÇÕES DE QUALIDADE:
+• Volume: SPIKE confirmado (150%+ acima da média)
+• Volume Profile: Rompimento POC intradiário confirmado
+• Filtros Macro: SEM conflitos detectados
+
+🤖 MACHINE LEARNING:
+• Confiança: {ml_confidence:.1%} (Aprovado - Threshold: 60%)
+• Confluência de {confirmations} fatores técnicos
+
+💰 GESTÃO DE RISCO PROFISSIONAL:
+• Risk/Reward: {risk_reward_ratio:.2f}:1 (Mínimo: 1.5:1)
+• Stop Loss: 1.0 ATR | Take Profits: 1.5/2.0/3.0 ATR
+• Estratégia sustentável para longo prazo
+
+⚡ SETUP DE ALTA QUALIDADE - APROVADO PARA EXECUÇÃO
+"""
+
+def build_analysis_text(direction, rsi, atr, ml_confidence, risk_reward_ratio):
+    """Render the professional analysis text of an approved signal"""
+    if rsi <= 35:
+        rsi_zone = '(EXTREMO - Sobrevendido)'
+    elif rsi >= 65:
+        rsi_zone = '(EXTREMO - Sobrecomprado)'
+    else:
+        rsi_zone = '(Neutro)'
     
-    return poc_break
+    return ANALYSIS_TEMPLATE.format_map({
+        'direction': direction,
+        'price_side': 'acima' if direction == 'BUY' else 'abaixo',
+        'rsi': rsi,
+        'rsi_zone': rsi_zone,
+        'atr': atr,
+        'ml_confidence': ml_confidence,
+        'confirmations': TECHNICAL_CONFIRMATIONS,
+        'risk_reward_ratio': risk_reward_ratio
+    })
 
 def macro_events_filter(symbol="BTCUSDT"):
     """REAL macro events filter using ForexFactory API"""
     from utils.macro_events_filter import check_fundamental_filter
     return check_fundamental_filter(symbol)
 
+# SL/TP1/TP2/TP3 offsets from entry in ATRs, signed for a BUY
+RISK_ATR_MULTIPLES = np.array([-1.0, 1.5, 2.0, 3.0])
+
 def professional_risk_management(entry_price, atr, direction):
-    """Professional Risk/Reward with SL=1.0 ATR, TPs=1.5/2.0/3.0 ATR"""
-    direction_multiplier = 1 if direction == "BUY" else -1
+    """
+    Professional Risk/Reward with SL=1.0 ATR, TPs=1.5/2.0/3.0 ATR
     
-    sl = entry_price - (direction_multiplier * atr * 1.0)
-    tp1 = entry_price + (direction_multiplier * atr * 1.5)
-    tp2 = entry_price + (direction_multiplier * atr * 2.0)
-    tp3 = entry_price + (direction_multiplier * atr * 3.0)
+    Accepts scalars or equally shaped arrays (e.g. replaying many entries in
+    a backtest); the four levels come out of one broadcast expression.
+    """
+    direction_multiplier = np.where(np.asarray(direction) == "BUY", 1.0, -1.0)
+    
+    levels = (np.asarray(entry_price, dtype=np.float64)[..., None]
+              + (direction_multiplier * atr)[..., None] * RISK_ATR_MULTIPLES)
     
-    return sl, tp1, tp2, tp3
+    # [()] unwraps 0-d results to scalars for single-signal calls
+    return levels[..., 0][()], levels[..., 1][()], levels[..., 2][()], levels[..., 3][()]
 
-def calculate_adx(df, window=14):
+def calculate_adx(arrays, window=14):
     """Calculate ADX for ML features"""
-    if len(df) < window + 1:
+    if len(arrays['close']) < window + 1:
         return 25.0  # Neutral ADX value
     
-    high = df['high']
-    low = df['low']
-    close = df['close']
-    
-    # Calculate True Range
-    tr1 = high - low
-    tr2 = abs(high - close.shift(1))
-    tr3 = abs(low - close.shift(1))
-    tr = pd.concat([tr1, tr2, tr3], axis=1).max(axis=1)
-    
-    # Calculate DM+ and DM-
-    dm_plus = high.diff()
-    dm_minus = low.diff() * -1
-    
-    dm_plus[dm_plus < 0] = 0
-    dm_minus[dm_minus < 0] = 0
-    
-    # Calculate smoothed values
-    tr_smooth = tr.rolling(window=window).mean()
-    dm_plus_smooth = dm_plus.rolling(window=window).mean()
-    dm_minus_smooth = dm_minus.rolling(window=window).mean()
+    return _adx_last(arrays['high'], arrays['low'], arrays['close'], window)
+
+@jit(nopython=True, nogil=True, cache=True)
+def _adx_last(high, low, close, window):
+    """
+    Last value of the ADX series calculate_adx used to build with pandas.
     
-    # Calculate DI+ and DI-
-    di_plus = (dm_plus_smooth / tr_smooth) * 100
-    di_minus = (dm_minus_smooth / tr_smooth) * 100
+    Same definition: SMA-smoothed TR and DM+/DM- (negative moves clipped to
+    0), DI = DM / TR * 100, DX = |DI+ - DI-| / (DI+ + DI-) * 100 and
+    ADX = SMA of DX, all over window bars. Running window sums replace the
+    rolling means, and only the DX values feeding the last ADX are kept.
     
-    # Calculate ADX
-    dx = abs(di_plus - di_minus) / (di_plus + di_minus) * 100
-    adx = dx.rolling(window=window).mean()
+    Returns:
+        ADX of the final bar, NaN with fewer than 2 * window bars
+    """
+    n = len(close)
+    if n < 2 * window:
+        return np.nan
+        
+    tr_sum = 0.0
+    dm_plus_sum = 0.0
+    dm_minus_sum = 0.0
+    dx_sum = 0.0
+    for i in range(1, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i - 1]), abs(low[i] - close[i - 1]))
+        tr_sum += tr
+        dm_plus_sum += max(high[i] - high[i - 1], 0.0)
+        dm_minus_sum += max(low[i - 1] - low[i], 0.0)
+        if i > window:
+            j = i - window
+            tr_sum -= max(high[j] - low[j], abs(high[j] - close[j - 1]), abs(low[j] - close[j - 1]))
+            dm_plus_sum -= max(high[j] - high[j - 1], 0.0)
+            dm_minus_sum -= max(low[j - 1] - low[j], 0.0)
+            
+        # DX values of the last window bars make up the final ADX
+        if i >= n - window:
+            if tr_sum == 0 or dm_plus_sum + dm_minus_sum == 0:
+                return np.nan  # pandas yields NaN/inf here, making ADX undefined
+            di_plus = dm_plus_sum / tr_sum * 100
+            di_minus = dm_minus_sum / tr_sum * 100
+            dx_sum += abs(di_plus - di_minus) / (di_plus + di_minus) * 100
+            
+    return dx_sum / window
+
+def _warm_up_kernels():
+    """
+    Compile the float32 specializations of the Numba kernels at import.
     
-    return adx.iloc[-1] if not adx.empty else 25.0
+    With cache=True they are loaded from the on-disk Numba cache (written to
+    __pycache__ next to this module) when available, so the first request
+    after a worker restart does not pay the JIT compilation.
+    """
+    candles = np.ones(250, dtype=np.float32)
+    _ema_last(candles, 200)
+    _last_bar_indicators(candles, candles, candles, candles, *INDICATOR_WINDOWS)
+    _adx_last(candles, candles, candles, 14)
+    _batch_last_bar_indicators(
+        candles.reshape(1, -1), candles.reshape(1, -1), candles.reshape(1, -1),
+        candles.reshape(1, -1), np.array([len(candles)], dtype=np.int64)
+    )
 
-def calculate_candle_body_ratio(df):
+_warm_up_kernels()
+
+def calculate_candle_body_ratio(arrays):
     """Calculate candle body ratio for ML features"""
-    if len(df) < 1:
+    if len(arrays['close']) < 1:
         return 0.5
     
-    candle = df.iloc[-1]
-    body = abs(candle['close'] - candle['open'])
-    total_range = candle['high'] - candle['low']
+    body = abs(arrays['close'][-1] - arrays['open'][-1])
+    total_range = arrays['high'][-1] - arrays['low'][-1]
     
     if total_range == 0:
         return 0.0
     
     return body / total_range
 
-def get_ml_confidence_real(df, rsi, atr):
+def get_ml_confidence_real(arrays, rsi, atr):
     """REAL ML confidence using trained model"""
     try:
         # Import real ML predictor
@@ -173,15 +432,15 @@ def get_ml_confidence_real(df, rsi, atr):
         from ml.ml_predictor import predict_signal_quality, get_prediction_confidence
         
         # Calculate real features
-        current_candle = df.iloc[-1]
-        volume_avg = df['volume'].rolling(20).mean().iloc[-1] if len(df) >= 20 else df['volume'].iloc[-1]
-        volume_ratio = current_candle['volume'] / volume_avg if volume_avg > 0 else 1.0
+        volume = arrays['volume']
+        volume_avg = volume[-20:].mean() if len(volume) >= 20 else volume[-1]
+        volume_ratio = volume[-1] / volume_avg if volume_avg > 0 else 1.0
         
         signal_features = {
             'rsi': rsi,
-            'adx': calculate_adx(df),
+            'adx': calculate_adx(arrays),
             'volume_ratio': volume_ratio,
-            'candle_body_ratio': calculate_candle_body_ratio(df)
+            'candle_body_ratio': calculate_candle_body_ratio(arrays)
         }
         
         # Get ML prediction
@@ -190,14 +449,14 @@ def get_ml_confidence_real(df, rsi, atr):
         
         if confidence_scores:
             max_confidence = max(confidence_scores.values())
-            logger.info(f"🤖 ML REAL: {ml_prediction} | Confiança: {max_confidence:.3f}")
-            logger.info(f"   Features: RSI={rsi:.2f}, ADX={signal_features['adx']:.2f}, Vol={volume_ratio:.2f}, Body={signal_features['candle_body_ratio']:.2f}")
+            logger.info("🤖 ML REAL: %s | Confiança: %.3f", ml_prediction, max_confidence)
+            logger.info("   Features: RSI=%.2f, ADX=%.2f, Vol=%.2f, Body=%.2f", rsi, signal_features['adx'], volume_ratio, signal_features['candle_body_ratio'])
             
             # Only accept if prediction is not LOSER and confidence is good
             if ml_prediction in ['WINNER', 'PARTIAL'] and max_confidence >= 0.60:
                 return max_confidence
             else:
-                logger.info(f"🛑 ML rejeitou: {ml_prediction} com confiança {max_confidence:.3f}")
+                logger.info("🛑 ML rejeitou: %s com confiança %.3f", ml_prediction, max_confidence)
                 return 0.0
         else:
             logger.warning("⚠️ ML não retornou confiança, usando fallback")
@@ -205,12 +464,12 @@ def get_ml_confidence_real(df, rsi, atr):
             
     except ImportError:
         logger.warning("⚠️ Modelo ML não disponível, usando fallback técnico")
-        return calculate_fallback_confidence(rsi, atr, df)
+        return calculate_fallback_confidence(rsi, atr, arrays)
     except Exception as e:
         logger.error(f"❌ Erro no ML real: {e}")
-        return calculate_fallback_confidence(rsi, atr, df)
+        return calculate_fallback_confidence(rsi, atr, arrays)
 
-def calculate_fallback_confidence(rsi, atr, df):
+def calculate_fallback_confidence(rsi, atr, arrays):
     """Fallback confidence calculation when ML is not available"""
     confidence_factors = []
     
@@ -223,9 +482,10 @@ def calculate_fallback_confidence(rsi, atr, df):
         confidence_factors.append(0.15)
     
     # Volume factor
-    if len(df) >= 20:
-        current_vol = df['volume'].iloc[-1]
-        avg_vol = df['volume'].rolling(20).mean().iloc[-1]
+    volume = arrays['volume']
+    if len(volume) >= 20:
+        current_vol = volume[-1]
+        avg_vol = volume[-20:].mean()
         if current_vol > avg_vol * 1.5:
             confidence_factors.append(0.25)
         elif current_vol > avg_vol:
@@ -236,7 +496,7 @@ def calculate_fallback_confidence(rsi, atr, df):
         confidence_factors.append(0.15)
     
     # Candle strength factor
-    body_ratio = calculate_candle_body_ratio(df)
+    body_ratio = calculate_candle_body_ratio(arrays)
     if body_ratio > 0.7:
         confidence_factors.append(0.20)
     elif body_ratio > 0.5:
@@ -245,106 +505,169 @@ def calculate_fallback_confidence(rsi, atr, df):
         confidence_factors.append(0.10)
     
     # ADX trend strength
-    adx = calculate_adx(df)
+    adx = calculate_adx(arrays)
     if adx > 25:
         confidence_factors.append(0.15)
     else:
         confidence_factors.append(0.10)
     
     total_confidence = sum(confidence_factors)
-    logger.info(f"🔄 Fallback confidence: {total_confidence:.3f} (RSI={rsi:.2f}, ADX={adx:.2f}, Body={body_ratio:.2f})")
+    logger.info("🔄 Fallback confidence: %.3f (RSI=%.2f, ADX=%.2f, Body=%.2f)", total_confidence, rsi, adx, body_ratio)
     
     return total_confidence
 
-def generate_monster_signal(symbol):
+def generate_monster_signal(symbol, current_price=None):
     """
     SIMPLIFIED PROFESSIONAL Monster Signal Generator
     New Flow: EMA 200 → RSI Extremes → Volume Spike → Volume Profile → Macro Filter → ML (60%)
+    
+    Fetches the market data, then hands it to analyze_monster_signal.
+    current_price may be passed in from a prefetched tickers snapshot;
+    otherwise it is looked up in the shared ticker cache.
     """
     try:
-        logger.info(f"🔍 [PROFESSIONAL] Analyzing {symbol} with simplified indicators...")
+        logger.info("🔍 [PROFESSIONAL] Analyzing %s with simplified indicators...", symbol)
         
         # Get current market price first
-        current_price = get_current_price(symbol)
+        if current_price is None:
+            current_price = market_data_service.get_single_price(symbol) or 0
         if current_price == 0:
-            logger.warning(f"Could not get current price for {symbol}")
+            logger.warning("Could not get current price for %s", symbol)
             current_price = None
         else:
-            logger.info(f"Current market price for {symbol}: {current_price}")
+            logger.info("Current market price for %s: %s", symbol, current_price)
+        
+        candles = fetch_monster_candles(symbol)
+        if candles is None:
+            return None
+        
+        return analyze_monster_signal(symbol, candles, current_price)
         
+    except Exception as e:
+        logger.error(f"Error fetching market data for {symbol}: {str(e)}")
+        logger.error(traceback.format_exc())
+        return None
+
+def fetch_monster_candles(symbol):
+    """
+    Fetch the 15m candles the monster filters run on.
+    
+    Returns:
+        Dict of OHLCV arrays (see fetch_data_np), or None when no data came back
+    """
+    try:
         # Fetch 15m data for analysis (sufficient for professional signals)
-        df_15m = fetch_data(symbol, "15", limit=250)  # Need more data for EMA 200
+        candles = fetch_data_np(symbol, "15", limit=MONSTER_CANDLES)  # Need more data for EMA 200
         
-        if df_15m.empty:
-            logger.warning(f"Insufficient data for {symbol}")
+        if len(candles['close']) == 0:
+            logger.warning("Insufficient data for %s", symbol)
             return None
         
+        return candles
+        
+    except Exception as e:
+        logger.error(f"Error fetching market data for {symbol}: {str(e)}")
+        return None
+
+def analyze_monster_signal(symbol, candles, current_price=None, indicators=None, now=None, arrays=None):
+    """
+    Apply the monster signal filters to already fetched market data.
+    
+    Pure computation on the candles, except for the macro events filter,
+    which is only consulted for symbols that passed the technical filters.
+    
+    Args:
+        symbol: Trading pair symbol (e.g., 'BTCUSDT')
+        candles: 15m OHLCV candles, oldest first (DataFrame or fetch_data_np dict)
+        current_price: Latest market price, or None to use the last close
+        indicators: Precomputed last_bar_indicators, e.g. from
+                    batch_last_bar_indicators; computed when None
+        now: UTC time to stamp the signal with, shared across a batch;
+             read from the clock when None
+        arrays: candles already converted by _to_arrays; converted when None
+        
+    Returns:
+        Signal dict, or None when a filter rejects the setup
+    """
+    try:
+        if arrays is None:
+            arrays = _to_arrays(candles)
+        
         # Use current market price if available, otherwise use latest close
-        entry = current_price if current_price else float(df_15m['close'].iloc[-1])
+        last_close = float(np.asarray(candles['close'])[-1])
+        entry = current_price if current_price else last_close
+        
+        if len(arrays['close']) < 200:
+            logger.info("🛑 EMA 200 trend undefined for %s", symbol)
+            return None
+        
+        # All indicator values needed below, computed once on the last candle
+        if indicators is None:
+            indicators = last_bar_indicators(arrays)
+        rsi = indicators['rsi']
+        atr = indicators['atr']
         
         # ============================================================================
         # STEP 1: EMA 200 - Main Trend Direction (Simplified)
         # ============================================================================
-        direction = get_ema200_direction(df_15m)
+        direction, ema_200 = get_ema200_direction(arrays, indicators['ema_200'])
         if direction is None:
-            logger.info(f"🛑 EMA 200 trend undefined for {symbol}")
+            logger.info("🛑 EMA 200 trend undefined for %s", symbol)
             return None
         
-        logger.info(f"✅ EMA 200 direction: {direction}")
+        logger.info("✅ EMA 200 direction: %s", direction)
         
         # ============================================================================
         # STEP 2: RSI Extremes and Divergences (Professional approach)
         # ============================================================================
-        rsi = calculate_rsi(df_15m['close'], window=14).iloc[-1]
-        
         if not rsi_extremes_filter(rsi, direction):
-            logger.info(f"🛑 RSI not in extreme zone for {direction}: {rsi:.2f}")
+            logger.info("🛑 RSI not in extreme zone for %s: %.2f", direction, rsi)
             return None
         
-        logger.info(f"✅ RSI extreme confirmed: {rsi:.2f}")
+        logger.info("✅ RSI extreme confirmed: %.2f", rsi)
         
         # ============================================================================
         # STEP 3: Volume Spike Confirmation (150% above average)
         # ============================================================================
-        if not volume_spike_confirmation(df_15m, multiplier=1.5):
-            logger.info(f"🛑 Volume spike not confirmed for {symbol}")
+        if not arrays['volume'][-1] > indicators['volume_avg'] * 1.5:
+            logger.info("🛑 Volume spike not confirmed for %s", symbol)
             return None
         
-        logger.info(f"✅ Volume spike confirmed (150%+ above average)")
+        logger.info("✅ Volume spike confirmed (150%+ above average)")
         
         # ============================================================================
         # STEP 4: Volume Profile POC Breakout
         # ============================================================================
-        if not volume_profile_confirmation(df_15m):
-            logger.info(f"🛑 Volume Profile POC breakout not confirmed for {symbol}")
+        vwap = indicators['vwap']
+        if not abs(last_close - vwap) / vwap > 0.002:
+            logger.info("🛑 Volume Profile POC breakout not confirmed for %s", symbol)
             return None
         
-        logger.info(f"✅ Volume Profile POC breakout confirmed")
+        logger.info("✅ Volume Profile POC breakout confirmed")
         
         # ============================================================================
         # STEP 5: REAL Macro Events Filter (ForexFactory API)
         # ============================================================================
         if not macro_events_filter(symbol):
-            logger.info(f"🛑 REAL macro events filter blocked signal for {symbol}")
+            logger.info("🛑 REAL macro events filter blocked signal for %s", symbol)
             return None
         
-        logger.info(f"✅ REAL macro events filter passed")
+        logger.info("✅ REAL macro events filter passed")
         
         # ============================================================================
         # STEP 6: REAL ML Confidence Check (Trained Model)
         # ============================================================================
-        ml_confidence = get_ml_confidence_real(df_15m, rsi, atr)
+        ml_confidence = get_ml_confidence_real(arrays, rsi, atr)
         
         if ml_confidence < 0.60:
-            logger.info(f"🛑 REAL ML confidence too low: {ml_confidence:.3f}")
+            logger.info("🛑 REAL ML confidence too low: %.3f", ml_confidence)
             return None
         
-        logger.info(f"✅ REAL ML confidence approved: {ml_confidence:.3f}")
+        logger.info("✅ REAL ML confidence approved: %.3f", ml_confidence)
         
         # ============================================================================
         # STEP 7: Professional Risk Management (SL=1.0 ATR, TPs=1.5/2.0/3.0 ATR)
         # ============================================================================
-        atr = calculate_atr(df_15m['high'], df_15m['low'], df_15m['close'], window=14).iloc[-1]
         sl, tp1, tp2, tp3 = professional_risk_management(entry, atr, direction)
         
         # Risk/Reward validation (must be >= 1.5:1)
@@ -353,40 +676,13 @@ def generate_monster_signal(symbol):
         risk_reward_ratio = reward / risk if risk > 0 else 0
         
         if risk_reward_ratio < 1.5:
-            logger.info(f"🛑 Risk/Reward ratio too low: {risk_reward_ratio:.2f}")
+            logger.info("🛑 Risk/Reward ratio too low: %.2f", risk_reward_ratio)
             return None
         
-        logger.info(f"✅ Professional Risk/Reward: {risk_reward_ratio:.2f}:1")
-        
-        # Generate professional analysis text
-        analysis_text = f"""Análise Técnica PROFISSIONAL - Sistema Simplificado:
-
-📊 DIREÇÃO PRINCIPAL:
-• EMA 200: Tendência {direction} confirmada
-• Preço {'acima' if direction == 'BUY' else 'abaixo'} da média móvel de longo prazo
-
-🎯 INDICADORES EXTREMOS:
-• RSI: {rsi:.2f} {'(EXTREMO - Sobrevendido)' if rsi <= 35 else '(EXTREMO - Sobrecomprado)' if rsi >= 65 else '(Neutro)'}
-• ATR: {atr:.6f} (Volatilidade para gestão de risco)
-
-📈 CONFIRMAÇÕES DE QUALIDADE:
-• Volume: SPIKE confirmado (150%+ acima da média)
-• Volume Profile: Rompimento POC intradiário confirmado
-• Filtros Macro: SEM conflitos detectados
-
-🤖 MACHINE LEARNING:
-• Confiança: {ml_confidence:.1%} (Aprovado - Threshold: 60%)
-• Confluência de {len([f for f in confidence_factors if f > 0])} fatores técnicos
-
-💰 GESTÃO DE RISCO PROFISSIONAL:
-• Risk/Reward: {risk_reward_ratio:.2f}:1 (Mínimo: 1.5:1)
-• Stop Loss: 1.0 ATR | Take Profits: 1.5/2.0/3.0 ATR
-• Estratégia sustentável para longo prazo
-
-⚡ SETUP DE ALTA QUALIDADE - APROVADO PARA EXECUÇÃO
-"""
+        logger.info("✅ Professional Risk/Reward: %.2f:1", risk_reward_ratio)
         
         # Create professional signal
+        now = now or datetime.utcnow()
         signal = {
             'symbol': symbol,
             'direction': direction,
@@ -398,17 +694,18 @@ def generate_monster_signal(symbol):
             'tp3': round(tp3, 6),
             'atr': round(atr, 6),
             'rsi': round(rsi, 2),
+            'ema_200': round(ema_200, 6),
             'current_price': current_price,
-            'timestamp': datetime.utcnow().isoformat(),
-            'expires': (datetime.utcnow() + timedelta(minutes=5)).isoformat(),
+            'timestamp': now.isoformat(),
+            'expires': (now + timedelta(minutes=5)).isoformat(),
             'strategy': 'monster_professional_simplified',
             'success_prob': round(ml_confidence, 2),  # Realistic confidence
             'risk_reward_ratio': round(risk_reward_ratio, 2),
-            'analysis': analysis_text
+            'analysis': build_analysis_text(direction, rsi, atr, ml_confidence, risk_reward_ratio)
         }
         
-        logger.info(f"✅ PROFESSIONAL MONSTER signal generated {signal['direction']} @ {signal['entry_price']} ({symbol})")
-        logger.info(f"   RSI: {rsi:.2f}, ATR: {atr:.6f}, R/R: {risk_reward_ratio:.2f}, ML: {ml_confidence:.1%}")
+        logger.info("✅ PROFESSIONAL MONSTER signal generated %s @ %s (%s)", signal['direction'], signal['entry_price'], symbol)
+        logger.info("   RSI: %.2f, ATR: %.6f, R/R: %.2f, ML: %.1f%%", rsi, atr, risk_reward_ratio, ml_confidence * 100)
         
         return signal
         
@@ -432,16 +729,50 @@ def generate_monster_signals():
         
         logger.info(f"Starting monster signal generation for {len(symbols)} symbols using Bybit data")
         
-        # Get current market prices for all symbols
+        # One clock read stamps every signal of the batch
+        now = datetime.utcnow()
+        created_at = int(now.replace(tzinfo=timezone.utc).timestamp())
+        
+        # Get current market prices for all symbols in one tickers request
         current_prices = market_data_service.get_current_prices(symbols)
         logger.info(f"Retrieved current prices for {len(current_prices)} symbols")
         
-        # Generate signals for each symbol
+        # Symbols missing from a good snapshot are delisted or misspelled: skip
+        # them before fetching candles. An empty snapshot means the tickers
+        # request failed, so every symbol is still analyzed on its last close.
+        if current_prices:
+            skipped = [symbol for symbol in symbols if not current_prices.get(symbol)]
+            if skipped:
+                logger.info(f"Skipping {len(skipped)} symbols without a current price: {', '.join(skipped)}")
+                symbols = [symbol for symbol in symbols if current_prices.get(symbol)]
+        
+        with ThreadPoolExecutor(max_workers=max(1, min(MONSTER_WORKERS, len(symbols)))) as executor:
+            # Fetch candles concurrently: each symbol waits on a Bybit round trip
+            candles = list(executor.map(fetch_monster_candles, symbols))
+            
+            # Convert each symbol's candles once; the batch kernel and the filters share them
+            arrays = [None if columns is None else _to_arrays(columns) for columns in candles]
+            
+            # Indicators of every symbol in one kernel call
+            fetched = [i for i, values in enumerate(arrays) if values is not None]
+            indicators = [None] * len(symbols)
+            batch = batch_last_bar_indicators([arrays[i] for i in fetched])
+            for i, values in zip(fetched, batch):
+                indicators[i] = values
+            
+            # Filters, macro events and ML per symbol; the ADX kernel releases the GIL
+            signals = list(executor.map(
+                lambda i: None if candles[i] is None else analyze_monster_signal(
+                    symbols[i], candles[i], current_prices.get(symbols[i]), indicators[i], now, arrays[i]
+                ),
+                range(len(symbols))
+            ))
+        
+        # Convert signals to frontend format
         generated_signals = []
         
-        for symbol in symbols:
+        for symbol, signal in zip(symbols, signals):
             try:
-                signal = generate_monster_signal(symbol)
                 if signal:
                     # Use current market price if available
                     if symbol in current_prices:
@@ -450,7 +781,7 @@ def generate_monster_signals():
                     
                     # Convert to frontend format
                     frontend_signal = {
-                        'id': f"monster_bybit_{signal['symbol']}_{int(datetime.now().timestamp())}",
+                        'id': f"monster_bybit_{signal['symbol']}_{created_at}",
                         'symbol': signal['symbol'],
                         'pair': signal['symbol'],
                         'direction': signal['direction'],
@@ -483,7 +814,7 @@ def generate_monster_signals():
                                 'hit': False
                             }
                         ],
-                        'analysis': signal.get('analysis', '')
+                        'analysis': signal['analysis']
                     }
                     generated_signals.append(frontend_signal)
                     
@@ -497,7 +828,7 @@ def generate_monster_signals():
             'signals': generated_signals,
             'total': len(generated_signals),
             'strategy': 'monster_1h_15m_multi_bybit',
-            'timestamp': datetime.utcnow().isoformat(),
+            'timestamp': now.isoformat(),
             'market_data_source': 'bybit_realtime',
             'current_prices': current_prices
         })
@@ -519,7 +850,7 @@ def get_monster_generation_status():
     """
     try:
         # Test Bybit connectivity
-        test_price = get_current_price('BTCUSDT')
+        test_price = market_data_service.get_single_price('BTCUSDT') or 0
         market_connected = test_price > 0
         
         return jsonify({
@@ -560,7 +891,7 @@ def health_check():
     try:
         # Test data fetching capability
         test_df = fetch_data('BTCUSDT', '15', limit=5)
-        test_price = get_current_price('BTCUSDT')
+        test_price = market_data_service.get_single_price('BTCUSDT') or 0
         
         return jsonify({
             'status': 'healthy',
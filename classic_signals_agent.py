@@ -13,10 +13,12 @@ from flask import Flask, jsonify, request
 from flask_cors import CORS
 import pandas as pd
 import numpy as np
-import requests
 import time
 from typing import Dict, Optional, List, Tuple
 
+from api.http_session import SESSION
+from api.hybrid_signals_api import frame_to_records
+
 app = Flask(__name__)
 CORS(app)
 
@@ -40,21 +42,22 @@ def get_klines(symbol: str, interval: str, limit: int = 200) -> pd.DataFrame:
             'limit': limit
         }
         
-        response = requests.get(url, params=params, timeout=10)
+        response = SESSION.get(url, params=params, timeout=10)
         response.raise_for_status()
         
         data = response.json()
         
-        df = pd.DataFrame(data, columns=[
-            'timestamp', 'open', 'high', 'low', 'close', 'volume',
-            'close_time', 'quote_asset_volume', 'number_of_trades',
-            'taker_buy_base_asset_volume', 'taker_buy_quote_asset_volume', 'ignore'
-        ])
-        
-        # Convert to numeric
-        numeric_columns = ['open', 'high', 'low', 'close', 'volume']
-        for col in numeric_columns:
-            df[col] = pd.to_numeric(df[col])
+        if not data:
+            return pd.DataFrame()
+            
+        # Rows are [open_time, open, high, low, close, volume, close_time, ...]
+        # with prices as strings: parse the OHLCV block into floats in one pass
+        rows = np.array(data, dtype=object)
+        df = pd.DataFrame(
+            rows[:, 1:6].astype(np.float64),
+            columns=['open', 'high', 'low', 'close', 'volume']
+        )
+        df.insert(0, 'timestamp', rows[:, 0].astype(np.int64))
             
         return df
         
@@ -313,7 +316,7 @@ def get_classic_history():
             return jsonify([])
         
         df = pd.read_csv(CLASSIC_HISTORY_FILE)
-        return jsonify(df.to_dict('records'))
+        return jsonify(frame_to_records(df))
         
     except Exception as e:
         print(f"Error reading classic history: {e}")
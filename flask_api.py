@@ -9,7 +9,6 @@ from flask import Flask, jsonify, request, g
 from flask_cors import CORS
 from datetime import datetime, timedelta
 import os
-import requests
 import json
 import functools
 import logging
@@ -29,6 +28,9 @@ from firebase_admin import firestore
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+# Pooled HTTP session shared by the direct Bybit calls below
+from api.http_session import SESSION
+
 try:
     from strategies.bollinger_bands import strategy_bollinger_bands
     from backtesting.performance import generate_performance_report
@@ -792,7 +794,7 @@ def get_current_price(symbol):
     """Busca o preço atual via API Bybit"""
     try:
         url = f"https://api.bybit.com/v5/market/tickers?category=linear&symbol={symbol}"
-        response = requests.get(url, timeout=5)
+        response = SESSION.get(url, timeout=5)
         data = response.json()
         if data['retCode'] == 0 and len(data['result']['list']) > 0:
             return float(data['result']['list'][0]['lastPrice'])
@@ -804,7 +806,7 @@ def get_candles(symbol, interval="1h", limit=200):
     """Busca candles via API Bybit"""
     try:
         url = f"https://api.bybit.com/v5/market/kline?category=linear&symbol={symbol}&interval={interval}&limit={limit}"
-        response = requests.get(url, timeout=10)
+        response = SESSION.get(url, timeout=10)
         data = response.json()
         if data['retCode'] == 0:
             candles = []
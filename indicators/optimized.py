@@ -125,6 +125,124 @@ def atr_numba(high, low, close, window=14):
     
     return atr
 
+@jit(nopython=True, cache=True)
+def ema_last(prices, span):
+    """
+    Last value of the EMA (adjust=False, as ta's EMAIndicator) of a price array.
+    
+    Args:
+        prices: Array of price values
+        span: EMA span
+        
+    Returns:
+        Final EMA value, NaN with fewer than span prices
+    """
+    if len(prices) < span:
+        return np.nan
+    
+    alpha = 2.0 / (span + 1.0)
+    ema = prices[0]
+    for i in range(1, len(prices)):
+        ema = alpha * prices[i] + (1.0 - alpha) * ema
+    return ema
+
+@jit(nopython=True, cache=True)
+def ema_pair_last(prices, fast_span, slow_span):
+    """
+    Last values of a fast and a slow EMA (as ema_last) in a single pass.
+    
+    Args:
+        prices: Array of price values
+        fast_span: Fast EMA span
+        slow_span: Slow EMA span
+        
+    Returns:
+        Tuple of (fast EMA, slow EMA); each NaN with fewer prices than its span
+    """
+    fast_alpha = 2.0 / (fast_span + 1.0)
+    slow_alpha = 2.0 / (slow_span + 1.0)
+    fast = prices[0]
+    slow = prices[0]
+    for i in range(1, len(prices)):
+        fast = fast_alpha * prices[i] + (1.0 - fast_alpha) * fast
+        slow = slow_alpha * prices[i] + (1.0 - slow_alpha) * slow
+    
+    if len(prices) < fast_span:
+        fast = np.nan
+    if len(prices) < slow_span:
+        slow = np.nan
+    return fast, slow
+
+@jit(nopython=True, cache=True)
+def rsi_last(prices, window=14):
+    """
+    Last value of the Wilder RSI (as ta's RSIIndicator) of a price array.
+    
+    Args:
+        prices: Array of price values
+        window: RSI calculation window (default: 14)
+        
+    Returns:
+        Final RSI value, NaN with window prices or fewer
+    """
+    if len(prices) <= window:
+        return np.nan
+    
+    # Smoothed gains and losses, seeded with the first move
+    up = max(prices[1] - prices[0], 0.0)
+    down = max(prices[0] - prices[1], 0.0)
+    for i in range(2, len(prices)):
+        delta = prices[i] - prices[i - 1]
+        up += (max(delta, 0.0) - up) / window
+        down += (max(-delta, 0.0) - down) / window
+    
+    if down == 0:
+        return 100.0
+    return 100.0 - 100.0 / (1.0 + up / down)
+
+@jit(nopython=True, cache=True)
+def atr_last(high, low, close, window=14):
+    """
+    Last value of atr_numba (as ta's AverageTrueRange) without the full series.
+    
+    Args:
+        high: Array of high prices
+        low: Array of low prices
+        close: Array of close prices
+        window: ATR window (default: 14)
+        
+    Returns:
+        Final ATR value, NaN with fewer than window candles
+    """
+    n = len(high)
+    if n < window:
+        return np.nan
+    
+    # Seed with the mean true range of the first window candles
+    atr = high[0] - low[0]
+    for i in range(1, window):
+        atr += max(high[i] - low[i], abs(high[i] - close[i-1]), abs(low[i] - close[i-1]))
+    atr /= window
+    
+    for i in range(window, n):
+        tr = max(high[i] - low[i], abs(high[i] - close[i-1]), abs(low[i] - close[i-1]))
+        atr = (atr * (window - 1) + tr) / window
+    
+    return atr
+
+def _warm_up_kernels():
+    """
+    Compile the last-value kernels at import so the first signal scan does
+    not pay the JIT compilation (loaded from the on-disk cache when present).
+    """
+    prices = np.ones(210)
+    ema_last(prices, 200)
+    ema_pair_last(prices, 50, 200)
+    rsi_last(prices, 14)
+    atr_last(prices, prices, prices, 14)
+
+_warm_up_kernels()
+
 def apply_optimized_indicators(df):
     """
     Apply all optimized indicators to a DataFrame.
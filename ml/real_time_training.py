@@ -54,25 +54,6 @@ class RealTimeMLTrainer:
             if df_trades.empty:
                 return None, None
             
-            # Features básicas existentes
-            basic_features = ['rsi', 'adx', 'volume_ratio', 'candle_body_ratio']
-            
-            # Adiciona features avançadas calculadas
-            df_trades['rsi_normalized'] = df_trades['rsi'] / 100
-            df_trades['success_prob_feature'] = df_trades.get('success_prob', 0.5)
-            df_trades['atr_normalized'] = df_trades.get('atr', 0) / 1000
-            df_trades['score_normalized'] = df_trades.get('score', 0.5)
-            
-            # Features direcionais
-            df_trades['is_buy'] = (df_trades['direction'] == 'BUY').astype(int)
-            df_trades['is_sell'] = (df_trades['direction'] == 'SELL').astype(int)
-            
-            # Calcula momentum baseado em timestamps
-            df_trades['timestamp_dt'] = pd.to_datetime(df_trades['timestamp'])
-            df_trades = df_trades.sort_values('timestamp_dt')
-            df_trades['hour_of_day'] = df_trades['timestamp_dt'].dt.hour
-            df_trades['day_of_week'] = df_trades['timestamp_dt'].dt.dayofweek
-            
             # Features finais para o modelo
             feature_columns = [
                 'rsi_normalized', 'adx', 'volume_ratio', 'candle_body_ratio',
@@ -80,8 +61,29 @@ class RealTimeMLTrainer:
                 'is_buy', 'is_sell', 'hour_of_day'
             ]
             
-            # Remove linhas com valores nulos
-            df_clean = df_trades.dropna(subset=feature_columns + ['result'])
+            # Monta só as colunas necessárias num único DataFrame
+            timestamp_dt = pd.to_datetime(df_trades['timestamp'])
+            df_features = pd.DataFrame({
+                'rsi_normalized': df_trades['rsi'] / 100,
+                'adx': df_trades['adx'],
+                'volume_ratio': df_trades['volume_ratio'],
+                'candle_body_ratio': df_trades['candle_body_ratio'],
+                'success_prob_feature': df_trades.get('success_prob', 0.5),
+                'atr_normalized': df_trades.get('atr', 0) / 1000,
+                'score_normalized': df_trades.get('score', 0.5),
+                # Features direcionais
+                'is_buy': (df_trades['direction'] == 'BUY').astype(int),
+                'is_sell': (df_trades['direction'] == 'SELL').astype(int),
+                'hour_of_day': timestamp_dt.dt.hour,
+                'result': df_trades['result'],
+                'timestamp_dt': timestamp_dt
+            })
+            
+            # Remove linhas com valores nulos e ordena por tempo
+            df_clean = (
+                df_features.dropna(subset=feature_columns + ['result'])
+                .sort_values('timestamp_dt', kind='stable')
+            )
             
             if len(df_clean) < self.min_samples_for_retrain:
                 logger.warning(f"⚠️ Dados insuficientes para treino: {len(df_clean)} < {self.min_samples_for_retrain}")
@@ -38,6 +38,9 @@ class PriceMonitor:
             self.history = pd.DataFrame(columns=['symbol', 'signal_time', 'exec_time', 
                                                 'signal_price', 'exec_price', 'delta',
                                                 'latency_ms', 'within_spread'])
+            
+        # Rows of self.history already in history_file; later saves append the rest
+        self._saved_rows = len(self.history)
 
     def record_execution(self, signal, executed_price, execution_time=None):
         """
@@ -82,9 +85,14 @@ class PriceMonitor:
             self._save_history()
             
     def _save_history(self):
-        """Save history to CSV file."""
+        """Append unsaved history rows to the CSV file (rewrite it if nothing is saved yet)."""
         try:
-            self.history.to_csv(self.history_file, index=False)
+            new_rows = self.history.iloc[self._saved_rows:]
+            if self._saved_rows == 0:
+                new_rows.to_csv(self.history_file, index=False)
+            else:
+                new_rows.to_csv(self.history_file, mode='a', header=False, index=False)
+            self._saved_rows = len(self.history)
         except Exception as e:
             self.logger.error(f"Failed to save history: {e}")
 
@@ -5,8 +5,26 @@ from trend_filter import get_trend, detect_structure
 from entry_conditions import validate_entry
 from risk_manager import define_trade_levels
 from ml.ml_predictor import predict_signal_quality
+import numpy as np
 import pandas as pd
 
+def calculate_last_rsi(close: np.ndarray, period: int = 14) -> float:
+    """
+    Calcula o RSI (médias simples de ganhos/perdas) apenas do último candle.
+
+    Retorna 50.0 quando não há histórico suficiente ou o preço ficou parado.
+    """
+    if len(close) <= period:
+        return 50.0
+
+    delta = np.diff(close[-(period + 1):])
+    avg_gain = np.maximum(delta, 0).mean()
+    avg_loss = np.maximum(-delta, 0).mean()
+
+    if avg_loss == 0:
+        return 100.0 if avg_gain > 0 else 50.0
+    return float(100 - 100 / (1 + avg_gain / avg_loss))
+
 def generate_trade_signal(symbol: str, df_4h: pd.DataFrame, df_current: pd.DataFrame) -> dict:
     """
     Gera um sinal completo de trade com base na tendência (EMA + estrutura),
@@ -39,7 +57,7 @@ def generate_trade_signal(symbol: str, df_4h: pd.DataFrame, df_current: pd.DataF
     # Etapa 4: Calcular features para ML
     # Usando valores do dataframe atual para calcular features
     close_prices = df_current['close']
-    rsi = close_prices.rolling(14).apply(lambda x: 100 - (100 / (1 + (x.diff().clip(lower=0).rolling(14).mean() / (-x.diff().clip(upper=0)).rolling(14).mean()))))
+    rsi = calculate_last_rsi(close_prices.to_numpy(dtype=float))
     
     # Calcular ADX (simplificado)
     high_low = df_current['high'] - df_current['low']
@@ -56,7 +74,7 @@ def generate_trade_signal(symbol: str, df_4h: pd.DataFrame, df_current: pd.DataF
     
     # Preparar features para ML
     signal_features = {
-        'rsi': rsi.iloc[-1] if not rsi.isna().iloc[-1] else 50.0,
+        'rsi': rsi,
         'adx': adx.iloc[-1] if not adx.isna().iloc[-1] else 25.0,
         'volume_ratio': volume_ratio,
         'candle_body_ratio': candle_body_ratio
@@ -6,9 +6,7 @@ import sqlite3
 import numpy as np
 from typing import Dict, Optional, List
 from datetime import datetime, timedelta
-from ta.trend import EMAIndicator
-from ta.volatility import AverageTrueRange
-from ta.momentum import RSIIndicator
+from indicators.optimized import ema_pair_last, rsi_last, atr_last
 from strategies.hybrid_logic import confirm_volume, confirm_candle, generate_entry
 from services.context_engine import ContextEngine
 from services.trainer import MLTrainer
@@ -26,6 +24,9 @@ from utils.quick_intraday_performance_alert import should_halt_intraday_trading
 logger = logging.getLogger("TradeAgent")
 logging.basicConfig(level=logging.INFO, format='%(asctime)s | %(levelname)s | %(message)s')
 
+# Entradas de is_trending memoizadas antes de limpar o cache
+TREND_CACHE_SIZE = 512
+
 class TradeAgent:
     def __init__(self, config: Dict, context_text: str = ""):
         self.config = config
@@ -38,6 +39,7 @@ class TradeAgent:
         self.feature_window = config.get("feature_window", 50)
         self.min_success_prob = config.get("min_success_prob", 0.65)  # Aumentado para 65%
         self.open_signals_cache = []  # Cache for duplicate prevention
+        self.trend_cache = {}  # (symbol, timeframe, último candle) -> resultado de is_trending
         
         # NOVOS COMPONENTES AVANÇADOS
         self.breakout_detector = FalseBreakoutDetector()
@@ -50,35 +52,42 @@ class TradeAgent:
         """Check if trend is up or down using EMA crossover"""
         if len(df) < window_slow:
             return False, False
-        ema_fast = EMAIndicator(close=df['close'], window=window_fast).ema_indicator().iloc[-1]
-        ema_slow = EMAIndicator(close=df['close'], window=window_slow).ema_indicator().iloc[-1]
+        ema_fast, ema_slow = ema_pair_last(df['close'].to_numpy(dtype=np.float64), window_fast, window_slow)
         return ema_fast > ema_slow, ema_fast < ema_slow
 
     def has_high_volume(self, df, window=20):
         """Check if current volume is above average"""
         if len(df) < window:
             return False
-        vol = df['volume'].iloc[-1]
-        mean_vol = df['volume'].rolling(window).mean().iloc[-1]
-        return vol > mean_vol
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        return volume[-1] > volume[-window:].mean()
 
     def is_strong_candle(self, df):
         """Check if last candle has strong body (>70% of total range) - MELHORADO"""
-        c = df.iloc[-1]
-        body = abs(c['close'] - c['open'])
-        total = c['high'] - c['low']
+        body = abs(df['close'].iat[-1] - df['open'].iat[-1])
+        total = df['high'].iat[-1] - df['low'].iat[-1]
         if total == 0:
             return False
         body_ratio = body / total
         logger.info(f"📊 Candle body ratio: {body_ratio:.2f} (mín: 0.70)")
         return body_ratio > 0.70  # Aumentado de 60% para 70%
 
-    def atr_filter(self, df, min_atr=0.002, max_atr=0.05):
+    def calculate_atr(self, df, window=14):
+        """ATR (Wilder) do último candle, para calcular uma única vez por sinal"""
+        return atr_last(
+            df['high'].to_numpy(dtype=np.float64),
+            df['low'].to_numpy(dtype=np.float64),
+            df['close'].to_numpy(dtype=np.float64),
+            window
+        )
+
+    def atr_filter(self, df, min_atr=0.002, max_atr=0.05, atr=None):
         """Filter by ATR percentage (0.2% to 5% of price) - mais flexível"""
         if len(df) < 14:
             logger.info(f"Dados insuficientes para ATR (len={len(df)})")
             return False
-        atr = AverageTrueRange(df['high'], df['low'], df['close'], window=14).average_true_range().iloc[-1]
+        if atr is None:
+            atr = self.calculate_atr(df)
         price = df['close'].iloc[-1]
         if price == 0:
             logger.warning("Preço zero para cálculo ATR")
@@ -94,10 +103,37 @@ class TradeAgent:
             logger.info(f"❌ ATR fora da faixa ({atr_pct:.2%})")
             return False
 
-    def get_direction(self, df_1h, df_15m):
+    def cached_trend(self, symbol, timeframe, df):
+        """
+        is_trending memoizado por símbolo, timeframe e último candle.
+        
+        O candle em formação entra na chave pelo timestamp e pelo fechamento,
+        então o resultado só é reutilizado enquanto os dados não mudam.
+        """
+        if 'timestamp' not in df or len(df) == 0:
+            return self.is_trending(df)
+        
+        key = (symbol, timeframe, len(df), df['timestamp'].iat[-1], float(df['close'].iat[-1]))
+        trend = self.trend_cache.get(key)
+        if trend is None:
+            if len(self.trend_cache) >= TREND_CACHE_SIZE:
+                self.trend_cache.clear()
+            trend = self.trend_cache[key] = self.is_trending(df)
+        return trend
+
+    def get_direction(self, df_1h, df_15m, symbol=None):
         """Determine direction based on multi-timeframe trend alignment"""
-        trend_up_1h, trend_down_1h = self.is_trending(df_1h)
-        trend_up_15, trend_down_15 = self.is_trending(df_15m)
+        def trend(timeframe, df):
+            if symbol is None:
+                return self.is_trending(df)
+            return self.cached_trend(symbol, timeframe, df)
+        
+        # 15m primeiro: sem tendência no 15m, o 1h não precisa ser calculado
+        trend_up_15, trend_down_15 = trend("15m", df_15m)
+        if not (trend_up_15 or trend_down_15):
+            return None
+        
+        trend_up_1h, trend_down_1h = trend("1h", df_1h)
         
         if trend_up_1h and trend_up_15:
             return "BUY"
@@ -118,18 +154,21 @@ class TradeAgent:
 
     def extract_features(self, df):
         """Extract features for ML prediction"""
-        latest = df.iloc[-1]
+        close = df['close'].to_numpy(dtype=np.float64)
+        volume = df['volume'].to_numpy(dtype=np.float64)
+        last_close = close[-1]
+        last_open = df['open'].iat[-1]
         
         # Calculate additional indicators for features
-        rsi = RSIIndicator(close=df['close'], window=14).rsi().iloc[-1] if len(df) >= 14 else 50
-        atr = AverageTrueRange(df['high'], df['low'], df['close'], window=14).average_true_range().iloc[-1] if len(df) >= 14 else 0
-        volume_ratio = latest['volume'] / df['volume'].rolling(20).mean().iloc[-1] if len(df) >= 20 else 1
+        rsi = rsi_last(close, 14) if len(df) >= 14 else 50
+        atr = self.calculate_atr(df) if len(df) >= 14 else 0
+        volume_ratio = volume[-1] / volume[-20:].mean() if len(df) >= 20 else 1
         
         features = [
             rsi / 100,
-            atr / latest['close'] if latest['close'] > 0 else 0,
+            atr / last_close if last_close > 0 else 0,
             volume_ratio,
-            (latest['close'] - latest['open']) / latest['close'] if latest['close'] > 0 else 0
+            (last_close - last_open) / last_close if last_close > 0 else 0
         ]
         return np.array(features).reshape(1, -1)
 
@@ -188,7 +227,7 @@ class TradeAgent:
                 logger.warning(f"🚨 Stress do mercado detectado para {symbol} - sendo conservador")
 
             # 4. DETERMINE DIRECTION BASED ON TREND ALIGNMENT
-            direction = self.get_direction(df_1h, df_15m)
+            direction = self.get_direction(df_1h, df_15m, symbol)
             if direction is None:
                 logger.info(f"🛑 Tendência não alinhada para {symbol}")
                 return None
@@ -205,7 +244,7 @@ class TradeAgent:
                 logger.info(f"🔄 Divergência RSI favorável detectada para {direction}")
 
             # 7. RSI FILTER - mais flexível mas com divergência
-            rsi = RSIIndicator(close=df_15m['close'], window=14).rsi().iloc[-1]
+            rsi = rsi_last(df_15m['close'].to_numpy(dtype=np.float64), 14)
             rsi_min_buy = 40 if has_favorable_divergence else 45  
             rsi_max_sell = 60 if has_favorable_divergence else 55
             
@@ -227,13 +266,14 @@ class TradeAgent:
                 logger.info(f"🛑 Candle fraco para {symbol}")
                 return None
             
-            if not self.atr_filter(df_15m):
+            # ATR calculado uma vez: usado no filtro e nos alvos
+            atr = self.calculate_atr(df_15m)
+            if not self.atr_filter(df_15m, atr=atr):
                 logger.info(f"🛑 ATR fora da faixa para {symbol}")
                 return None
 
             # 9. CALCULATE ENTRY AND ADVANCED TARGETS
             entry = float(df_15m['close'].iloc[-1])
-            atr = AverageTrueRange(df_15m['high'], df_15m['low'], df_15m['close'], window=14).average_true_range().iloc[-1]
             
             # Calcula ADX para targets dinâmicos
             from ta.trend import ADXIndicator
@@ -0,0 +1,103 @@
+
+"""
+Unit tests for the caching utilities.
+"""
+
+import pytest
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils import caching
+
+@pytest.fixture
+def cache_dir(tmp_path, monkeypatch):
+    """Fixture that points the disk cache at a temporary directory."""
+    monkeypatch.setattr(caching, 'DISK_CACHE_DIR', str(tmp_path))
+    return tmp_path
+
+def test_disk_cache_reuses_result(cache_dir):
+    """Test that a second call within the TTL is served from disk."""
+    calls = []
+
+    @caching.disk_cache(ttl=60)
+    def fetch(symbol):
+        calls.append(symbol)
+        return [symbol, len(calls)]
+
+    assert fetch('BTCUSDT') == ['BTCUSDT', 1]
+    assert fetch('BTCUSDT') == ['BTCUSDT', 1]
+    assert fetch('ETHUSDT') == ['ETHUSDT', 2]
+    assert calls == ['BTCUSDT', 'ETHUSDT']
+
+def test_disk_cache_expires(cache_dir):
+    """Test that entries older than the TTL are refetched."""
+    calls = []
+
+    @caching.disk_cache(ttl=0)
+    def fetch():
+        calls.append(1)
+        return len(calls)
+
+    assert fetch() == 1
+    assert fetch() == 2
+
+def test_disk_cache_serves_stale_result_on_error(cache_dir):
+    """Test that an expired entry is returned when the refetch fails."""
+    calls = []
+
+    @caching.disk_cache(ttl=0, stale_on_error=True)
+    def fetch():
+        calls.append(1)
+        if len(calls) > 1:
+            raise ConnectionError("network down")
+        return ['BTCUSDT']
+
+    assert fetch() == ['BTCUSDT']
+    assert fetch() == ['BTCUSDT']
+    assert len(calls) == 2
+
+def test_disk_cache_skips_rejected_results(cache_dir):
+    """Test that results failing cache_if are not stored."""
+    calls = []
+
+    @caching.disk_cache(ttl=60, cache_if=bool)
+    def fetch():
+        calls.append(1)
+        return []
+
+    fetch()
+    fetch()
+    assert len(calls) == 2
+
+def test_ttl_cache_reuses_recent_result():
+    """Test that results are reused within the TTL and refetched after it."""
+    calls = []
+    
+    @caching.ttl_cache(ttl=60)
+    def price(symbol):
+        calls.append(symbol)
+        return 100.0
+    
+    assert price('BTCUSDT') == 100.0
+    assert price('BTCUSDT') == 100.0
+    assert calls == ['BTCUSDT']
+    
+    price.cache_clear()
+    price('BTCUSDT')
+    assert calls == ['BTCUSDT', 'BTCUSDT']
+
+def test_ttl_cache_skips_rejected_results():
+    """Test that results failing cache_if are not stored."""
+    calls = []
+    
+    @caching.ttl_cache(ttl=60, cache_if=bool)
+    def price():
+        calls.append(1)
+        return 0.0
+    
+    price()
+    price()
+    assert len(calls) == 2
@@ -0,0 +1,77 @@
+
+"""
+Unit tests for the diversity analyzer module.
+"""
+
+import pytest
+import pandas as pd
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from analytics.diversity import DiversityAnalyzer
+
+@pytest.fixture
+def analyzer():
+    """Fixture that provides a DiversityAnalyzer instance."""
+    return DiversityAnalyzer()
+
+@pytest.fixture
+def signals_df():
+    """Fixture that provides a small multi-strategy signals DataFrame."""
+    return pd.DataFrame({
+        'strategy': ['rsi', 'rsi', 'macd', 'macd', 'breakout'],
+        'symbol': ['BTCUSDT', 'ETHUSDT', 'BTCUSDT', 'BTCUSDT', 'SOLUSDT'],
+        'timestamp': pd.to_datetime([
+            '2024-01-01 00:00:00',
+            '2024-01-01 01:00:00',
+            '2024-01-01 00:03:00',
+            '2024-01-01 03:00:00',
+            '2024-01-01 00:10:00',
+        ]),
+        'confidence': [0.5, 0.7, 0.9, None, 0.4]
+    })
+
+def test_overlap_counts_signals_within_window(analyzer, signals_df):
+    """Test that only signals within 5 minutes count as overlapping."""
+    matrix = analyzer.calculate_overlap(signals_df)
+
+    assert matrix.loc['rsi', 'rsi'] == 1.0
+    assert matrix.loc['rsi', 'macd'] == 0.5
+    assert matrix.loc['macd', 'rsi'] == 0.5
+    assert matrix.loc['rsi', 'breakout'] == 0.0
+
+def test_overlap_accepts_string_timestamps(analyzer, signals_df):
+    """Test that text timestamps are parsed before comparing strategies."""
+    signals_df['timestamp'] = signals_df['timestamp'].astype(str)
+    matrix = analyzer.calculate_overlap(signals_df)
+
+    assert matrix.loc['rsi', 'macd'] == 0.5
+
+def test_overlap_ignores_missing_timestamps(analyzer, signals_df):
+    """Test that signals with NaT timestamps are left out of the overlap."""
+    signals_df.loc[[1, 3], 'timestamp'] = pd.NaT
+    matrix = analyzer.calculate_overlap(signals_df)
+
+    assert matrix.loc['rsi', 'macd'] == 1.0
+    assert matrix.loc['rsi', 'breakout'] == 0.0
+
+def test_overlap_without_timestamp_column(analyzer, signals_df):
+    """Test that overlap cells are NaN when there is no timestamp column."""
+    matrix = analyzer.calculate_overlap(signals_df.drop(columns='timestamp'))
+
+    assert matrix.loc['rsi', 'rsi'] == 1.0
+    assert matrix.isna().sum().sum() == 6
+
+def test_report_keeps_naive_timestamps_naive(analyzer, signals_df):
+    """Test that text timestamps without an offset are reported without one."""
+    signals_df['timestamp'] = signals_df['timestamp'].astype(str)
+    report = analyzer.generate_report(signals_df)
+
+    assert report['date_range'] == {'start': '2024-01-01T00:00:00', 'end': '2024-01-01T03:00:00'}
+
+def test_overlap_empty_dataframe(analyzer):
+    """Test overlap on an empty DataFrame."""
+    assert analyzer.calculate_overlap(pd.DataFrame()).empty
@@ -0,0 +1,27 @@
+"""
+Unit tests for the Bybit kline fetcher caching.
+"""
+
+import numpy as np
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import fetch_data
+
+def test_api_errors_are_not_memoized(mocker):
+    """Test that a Bybit error falls back to mock data without being cached."""
+    fetch_data._fetch_klines_recent.cache_clear()
+    columns = {name: np.ones(3) for name in ('open', 'high', 'low', 'close', 'volume')}
+    fetch = mocker.patch.object(
+        fetch_data, '_fetch_klines',
+        side_effect=[RuntimeError("Bybit API error: rate limit"), columns]
+    )
+    
+    mock = fetch_data.fetch_data_np('BTCUSDT', '15', limit=3)
+    assert mock is not columns
+    assert fetch_data.fetch_data_np('BTCUSDT', '15', limit=3) is columns
+    assert fetch_data.fetch_data_np('BTCUSDT', '15', limit=3) is columns
+    assert fetch.call_count == 2
@@ -0,0 +1,78 @@
+
+"""
+Unit tests for the hybrid signals API helpers.
+"""
+
+import pandas as pd
+import numpy as np
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api.hybrid_signals_api import frame_to_records
+
+def test_frame_to_records_matches_to_dict():
+    """Test that records match to_dict(orient='records') with native types."""
+    df = pd.DataFrame({
+        'timestamp': ['2024-01-02T00:00:00', '2024-01-01T00:00:00'],
+        'symbol': ['BTCUSDT', 'ETHUSDT'],
+        'score': [3, 5],
+        'entry_price': [96500.5, np.nan]
+    })
+    
+    records = frame_to_records(df)
+    
+    assert str(records) == str(df.to_dict(orient='records'))
+    assert type(records[0]['score']) is int
+    assert type(records[0]['entry_price']) is float
+
+def test_frame_to_records_empty():
+    """Test that an empty frame yields no records."""
+    assert frame_to_records(pd.DataFrame(columns=['timestamp', 'symbol'])) == []
+
+def test_read_sorted_records_newest_first(tmp_path):
+    """Test that CSV records come back sorted by timestamp descending."""
+    from api.hybrid_signals_api import read_sorted_records
+    
+    file = tmp_path / 'historical_signals_hybrid.csv'
+    pd.DataFrame({
+        'timestamp': ['2024-01-01T10:00:00', '2024-01-03T10:00:00', '2024-01-02T10:00:00'],
+        'symbol': ['BTCUSDT', 'ETHUSDT', 'SOLUSDT'],
+        'score': [1, 2, 3]
+    }).to_csv(file, index=False)
+    
+    records = read_sorted_records(file)
+    
+    assert [r['symbol'] for r in records] == ['ETHUSDT', 'SOLUSDT', 'BTCUSDT']
+    assert records[0] == {'timestamp': '2024-01-03T10:00:00', 'symbol': 'ETHUSDT', 'score': 2}
+
+def test_load_payload_reparses_only_on_change(tmp_path, mocker):
+    """Test that the payload is cached until the CSV file changes."""
+    from api import hybrid_signals_api
+    
+    file = tmp_path / 'historical_signals_hybrid.csv'
+    file.write_text('timestamp,symbol\n2024-01-01T10:00:00,BTCUSDT\n')
+    spy = mocker.spy(hybrid_signals_api, 'read_sorted_records')
+    
+    assert hybrid_signals_api.load_payload(file)[0] == 1
+    assert hybrid_signals_api.load_payload(file)[0] == 1
+    assert spy.call_count == 1
+    
+    file.write_text('timestamp,symbol\n2024-01-01T10:00:00,BTCUSDT\n2024-01-02T10:00:00,ETHUSDT\n')
+    
+    assert hybrid_signals_api.load_payload(file)[0] == 2
+    assert spy.call_count == 2
+
+def test_read_sorted_records_reverses_chronological_file(tmp_path):
+    """Test that an already chronological CSV is returned newest first."""
+    from api.hybrid_signals_api import read_sorted_records
+    
+    file = tmp_path / 'historical_signals_hybrid.csv'
+    pd.DataFrame({
+        'timestamp': ['2024-01-01T10:00:00', '2024-01-02T10:00:00', '2024-01-03T10:00:00'],
+        'symbol': ['BTCUSDT', 'SOLUSDT', 'ETHUSDT']
+    }).to_csv(file, index=False)
+    
+    assert [r['symbol'] for r in read_sorted_records(file)] == ['ETHUSDT', 'SOLUSDT', 'BTCUSDT']
@@ -0,0 +1,111 @@
+
+"""
+Unit tests for the monster signals indicator helpers.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from api import monster_signals_api as monster
+
+@pytest.fixture
+def candles():
+    """Fixture that provides 250 random-walk OHLCV candles."""
+    rng = np.random.default_rng(0)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 250)))
+    return pd.DataFrame({
+        'open': close,
+        'high': close * (1 + rng.uniform(0, 0.01, 250)),
+        'low': close * (1 - rng.uniform(0, 0.01, 250)),
+        'close': close,
+        'volume': rng.uniform(1, 100, 250)
+    })
+
+def test_last_bar_indicators_match_pandas_helpers(candles):
+    """Test that the one-pass kernel matches the pandas indicator helpers."""
+    indicators = monster.last_bar_indicators(monster._to_arrays(candles))
+    
+    volume = candles['volume']
+    expected = {
+        'ema_200': monster.calculate_ema(candles['close'], 200).iloc[-1],
+        'rsi': monster.calculate_rsi(candles['close'], window=14).iloc[-1],
+        'atr': monster.calculate_atr(candles['high'], candles['low'], candles['close'], window=14).iloc[-1],
+        'volume_avg': volume.rolling(20).mean().iloc[-1],
+        'vwap': (candles['close'] * volume).rolling(50).sum().iloc[-1] / volume.rolling(50).sum().iloc[-1]
+    }
+    
+    for name, value in expected.items():
+        assert indicators[name] == pytest.approx(value), name
+
+def test_calculate_adx_matches_pandas_definition(candles):
+    """Test that the ADX kernel matches the rolling-mean ADX definition."""
+    high, low, close = candles['high'], candles['low'], candles['close']
+    tr = pd.concat([high - low, (high - close.shift()).abs(), (low - close.shift()).abs()], axis=1).max(axis=1)
+    dm_plus = high.diff().clip(lower=0)
+    dm_minus = (-low.diff()).clip(lower=0)
+    di_plus = dm_plus.rolling(14).mean() / tr.rolling(14).mean() * 100
+    di_minus = dm_minus.rolling(14).mean() / tr.rolling(14).mean() * 100
+    adx = ((di_plus - di_minus).abs() / (di_plus + di_minus) * 100).rolling(14).mean()
+    
+    assert monster.calculate_adx(monster._to_arrays(candles)) == pytest.approx(adx.iloc[-1])
+
+def test_batch_last_bar_indicators_match_single_symbol_kernel(candles):
+    """Test that the batch kernel matches per-symbol results for uneven lengths."""
+    arrays = monster._to_arrays(candles)
+    shorter = {name: values[30:] for name, values in arrays.items()}
+    too_short = {name: values[:100] for name, values in arrays.items()}
+    
+    batch = monster.batch_last_bar_indicators([arrays, shorter, too_short])
+    
+    assert batch[2] is None
+    for result, expected in zip(batch, [arrays, shorter]):
+        for name, value in monster.last_bar_indicators(expected).items():
+            assert result[name] == pytest.approx(value), name
+
+def test_analyze_monster_signal_builds_analysis_text(mocker):
+    """Test that an approved setup yields a signal with its analysis text."""
+    mocker.patch.object(monster, 'macro_events_filter', return_value=True)
+    mocker.patch.object(monster, 'get_ml_confidence_real', return_value=0.8)
+    
+    # Long uptrend with a sharp pullback on a volume spike: BUY with RSI oversold
+    close = np.concatenate([np.linspace(100, 200, 240), np.linspace(198, 180, 10)])
+    candles = {
+        'open': close, 'high': close * 1.002, 'low': close * 0.998, 'close': close,
+        'volume': np.r_[np.ones(249), 10.0]
+    }
+    
+    signal = monster.analyze_monster_signal('BTCUSDT', candles)
+    
+    assert signal['direction'] == 'BUY'
+    analysis = signal['analysis']
+    assert 'RSI: 16.00 (EXTREMO - Sobrevendido)' in analysis
+    assert 'Confluência de 4 fatores técnicos' in analysis
+
+def test_professional_risk_management_broadcasts_over_entries():
+    """Test that array inputs give the same levels as per-signal calls."""
+    entries = np.array([100.0, 50.0])
+    atrs = np.array([2.0, 1.0])
+    directions = np.array(['BUY', 'SELL'])
+    
+    levels = monster.professional_risk_management(entries, atrs, directions)
+    
+    assert monster.professional_risk_management(100.0, 2.0, 'BUY') == (98.0, 103.0, 104.0, 106.0)
+    for i in range(2):
+        expected = monster.professional_risk_management(entries[i], atrs[i], directions[i])
+        assert tuple(level[i] for level in levels) == pytest.approx(expected)
+
+def test_get_ema200_direction_reuses_known_ema(candles):
+    """Test that a precomputed EMA 200 gives the same trend as computing it."""
+    arrays = monster._to_arrays(candles)
+    ema_200 = monster.last_bar_indicators(arrays)['ema_200']
+    
+    direction, ema = monster.get_ema200_direction(arrays)
+    
+    assert ema == pytest.approx(ema_200)
+    assert monster.get_ema200_direction(arrays, ema_200) == (direction, ema_200)
@@ -0,0 +1,58 @@
+"""
+Unit tests for the Numba indicator kernels.
+"""
+
+import pytest
+import numpy as np
+import pandas as pd
+import sys
+import os
+
+# Add the project root to the path so we can import modules
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from indicators.optimized import ema_last, ema_pair_last, rsi_last, atr_last
+
+ta = pytest.importorskip("ta")
+
+@pytest.fixture
+def ohlc():
+    """Fixture that provides 210 random-walk OHLC candles."""
+    rng = np.random.default_rng(42)
+    close = 100 * np.exp(np.cumsum(rng.normal(0, 0.01, 210)))
+    return pd.DataFrame({
+        'high': close * (1 + rng.uniform(0, 0.01, 210)),
+        'low': close * (1 - rng.uniform(0, 0.01, 210)),
+        'close': close
+    })
+
+def test_last_value_kernels_match_ta(ohlc):
+    """Test that the last-value kernels match the ta indicators they replace."""
+    close = ohlc['close'].to_numpy()
+    high = ohlc['high'].to_numpy()
+    low = ohlc['low'].to_numpy()
+    
+    for window in (50, 200):
+        expected = ta.trend.EMAIndicator(close=ohlc['close'], window=window).ema_indicator().iloc[-1]
+        assert ema_last(close, window) == pytest.approx(expected)
+        
+    expected = ta.momentum.RSIIndicator(close=ohlc['close'], window=14).rsi().iloc[-1]
+    assert rsi_last(close, 14) == pytest.approx(expected)
+    
+    expected = ta.volatility.AverageTrueRange(ohlc['high'], ohlc['low'], ohlc['close'], window=14).average_true_range().iloc[-1]
+    assert atr_last(high, low, close, 14) == pytest.approx(expected)
+
+def test_last_value_kernels_need_a_full_window(ohlc):
+    """Test that too short inputs give NaN instead of a partial value."""
+    close = ohlc['close'].to_numpy()[:10]
+    
+    assert np.isnan(ema_last(close, 50))
+    assert np.isnan(rsi_last(close, 14))
+    assert np.isnan(atr_last(close, close, close, 14))
+
+def test_ema_pair_last_matches_separate_passes(ohlc):
+    """Test that the one-pass EMA pair equals two ema_last calls."""
+    close = ohlc['close'].to_numpy()
+    
+    assert ema_pair_last(close, 50, 200) == pytest.approx((ema_last(close, 50), ema_last(close, 200)))
+    assert np.isnan(ema_pair_last(close[:100], 50, 200)[1])
@@ -1,17 +1,18 @@
 
-import requests
 import json
 import joblib
 import numpy as np
 import pandas as pd
 import os
 import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from dotenv import load_dotenv
 from apscheduler.schedulers.background import BackgroundScheduler
 from services.evaluate_signals_pg import Signal, Base, main as avaliar_sinais
+from api.http_session import SESSION
 from sklearn.ensemble import RandomForestClassifier
 from indicators.optimized import rsi_numba
 import logging
@@ -44,6 +45,7 @@ SYMBOLS = [
 LOOKBACK = 100  # Number of candles to fetch for analysis
 MODEL_PATH = "ml/rf_hybrid_model.pkl"
 PREDICTION_THRESHOLD = 0.65  # Probability threshold for signal generation
+FETCH_WORKERS = 8  # Concurrent OHLCV requests, kept modest for Bybit rate limits
 
 # Initialize database connection
 engine = create_engine(DATABASE_URL)
@@ -68,7 +70,7 @@ def fetch_ohlcv(symbol, retries=3):
 
     for attempt in range(retries):
         try:
-            response = requests.get(BYBIT_ENDPOINT, params=params)
+            response = SESSION.get(BYBIT_ENDPOINT, params=params)
             data = response.json()
             
             if "result" not in data or "list" not in data["result"]:
@@ -77,11 +79,18 @@ def fetch_ohlcv(symbol, retries=3):
                     time.sleep(2)  # Wait before retry
                 continue
                 
-            candles = data["result"]["list"]
-            df = pd.DataFrame(candles, columns=["timestamp", "open", "high", "low", "close", "volume", "turnover"])
-            df = df.astype(float)
-            df["timestamp"] = pd.to_datetime(df["timestamp"], unit="ms")
-            return df
+            # Parse the string rows straight into a float matrix:
+            # [timestamp, open, high, low, close, volume, turnover]
+            candles = np.array(data["result"]["list"], dtype=np.float64).reshape(-1, 7)
+            return pd.DataFrame({
+                "timestamp": pd.to_datetime(candles[:, 0].astype(np.int64), unit="ms"),
+                "open": candles[:, 1],
+                "high": candles[:, 2],
+                "low": candles[:, 3],
+                "close": candles[:, 4],
+                "volume": candles[:, 5],
+                "turnover": candles[:, 6]
+            })
             
         except Exception as e:
             logger.error(f"Error fetching data for {symbol}: {e}")
@@ -245,15 +254,18 @@ def train_from_signals():
         logger.warning("No signals with results available for training")
         return False
     
+    # Only use signals with clear outcomes
+    sinais = [s for s in sinais if s.resultado in ["vencedor", "parcial", "perdedor", "falso"]]
+    
+    # Fetch historical data once per symbol, overlapping the network requests
+    symbols = list(dict.fromkeys(s.symbol for s in sinais))
+    with ThreadPoolExecutor(max_workers=FETCH_WORKERS) as executor:
+        ohlcv_by_symbol = dict(zip(symbols, executor.map(fetch_ohlcv, symbols)))
+    
     rows = []
     for s in sinais:
-        # Only use signals with clear outcomes
-        if s.resultado not in ["vencedor", "parcial", "perdedor", "falso"]:
-            continue
-            
         try:
-            # Fetch historical data
-            df = fetch_ohlcv(s.symbol)
+            df = ohlcv_by_symbol[s.symbol]
             if df.empty:
                 continue
                 
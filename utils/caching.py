@@ -8,9 +8,19 @@ of technical indicators and other computationally expensive operations.
 
 import functools
 import hashlib
+import os
+import tempfile
+import threading
+import time
 import pandas as pd
 import numpy as np
-from typing import Any, Callable, Dict, Tuple
+from typing import Any, Callable, Dict, Optional, Tuple
+
+# Root directory for on-disk caches (override with TRADE_ALERTS_CACHE_DIR)
+DISK_CACHE_DIR = os.getenv(
+    "TRADE_ALERTS_CACHE_DIR",
+    os.path.join(os.path.expanduser("~"), ".trade-alerts", "cache")
+)
 
 
 @functools.lru_cache(maxsize=128)
@@ -124,6 +134,115 @@ def memoize(func: Callable) -> Callable:
     return wrapper
 
 
+def disk_cache(ttl: float, cache_if: Optional[Callable[[Any], bool]] = None,
+               stale_on_error: bool = False) -> Callable:
+    """
+    Decorator to cache function results on disk for a limited time.
+    
+    Results are pickled under DISK_CACHE_DIR/<module.function>/<md5 of args>.pkl
+    and reused while the file is younger than ttl seconds, so repeated
+    network fetches survive process restarts.
+    
+    Args:
+        ttl: Time-to-live of a cached result in seconds
+        cache_if: Optional predicate; results for which it returns False
+                  (e.g. empty responses) are not written to the cache
+        stale_on_error: If the function raises, return the last cached
+                        result even when it has expired
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache_dir = os.path.join(DISK_CACHE_DIR, f"{func.__module__}.{func.__qualname__}")
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = hashlib.md5(repr((args, sorted(kwargs.items()))).encode()).hexdigest()
+            path = os.path.join(cache_dir, f"{key}.pkl")
+            
+            try:
+                if time.time() - os.path.getmtime(path) < ttl:
+                    return pd.read_pickle(path)
+            except Exception:
+                pass  # Missing, expired or unreadable entry: fetch again
+                
+            try:
+                result = func(*args, **kwargs)
+            except Exception:
+                if stale_on_error and os.path.exists(path):
+                    return pd.read_pickle(path)
+                raise
+            
+            if cache_if is None or cache_if(result):
+                tmp_path = None
+                try:
+                    os.makedirs(cache_dir, exist_ok=True)
+                    # Write atomically so concurrent readers never see a partial file
+                    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+                    os.close(fd)
+                    pd.to_pickle(result, tmp_path)
+                    os.replace(tmp_path, path)
+                except Exception:
+                    # Caching is best effort
+                    if tmp_path and os.path.exists(tmp_path):
+                        os.remove(tmp_path)
+                    
+            return result
+        
+        return wrapper
+    
+    return decorator
+
+
+def ttl_cache(ttl: float, maxsize: int = 256,
+              cache_if: Optional[Callable[[Any], bool]] = None) -> Callable:
+    """
+    Decorator to memoize function results in memory for a limited time.
+    
+    Meant for cheap-to-store but slow-to-fetch values such as live prices,
+    where several lookups of the same key within ttl seconds should share
+    one request. The lock only guards the cache, not the call itself, so
+    lookups of different keys still run concurrently.
+    
+    Args:
+        ttl: Time-to-live of a cached result in seconds
+        maxsize: Number of entries above which expired ones are purged
+        cache_if: Optional predicate; results for which it returns False
+                  (e.g. a 0.0 price on error) are not cached
+        
+    Returns:
+        Decorator
+    """
+    def decorator(func: Callable) -> Callable:
+        cache: Dict[Tuple, Tuple[float, Any]] = {}
+        lock = threading.Lock()
+        
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            key = (args, frozenset(kwargs.items()))
+            with lock:
+                entry = cache.get(key)
+            if entry is not None and time.monotonic() - entry[0] < ttl:
+                return entry[1]
+                
+            result = func(*args, **kwargs)
+            
+            if cache_if is None or cache_if(result):
+                now = time.monotonic()
+                with lock:
+                    if len(cache) >= maxsize:
+                        for stale in [k for k, (at, _) in cache.items() if now - at >= ttl]:
+                            del cache[stale]
+                    cache[key] = (now, result)
+            return result
+        
+        wrapper.cache_clear = cache.clear
+        return wrapper
+    
+    return decorator
+
+
 def clear_cache():
     """Clear all memoization caches."""
     global _memoize_cache
@@ -1,17 +1,23 @@
 
 import time
 import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
-from api.data_fetcher import get_current_price
+from api.data_fetcher import get_all_prices, get_current_price
 from utils.signal_storage import get_pending_signals, update_signal_result
 from utils.logger import logger
 
-def evaluate_signal(signal):
+# Concurrent price lookups when evaluating pending signals
+EVALUATION_WORKERS = 16
+
+def evaluate_signal(signal, prices=None):
     """
     Evaluate a signal against current market price.
     
     Args:
         signal: Signal dictionary with entry price, SL, TP levels
+        prices: Optional symbol -> price snapshot (see get_all_prices);
+                symbols missing from it are fetched individually
         
     Returns:
         Result string (WINNER, PARTIAL, LOSER, FALSE) or None if still pending
@@ -28,7 +34,7 @@ def evaluate_signal(signal):
         tp3 = signal.get("tp3", 0)
         
         # Get current price
-        current_price = get_current_price(symbol)
+        current_price = (prices or {}).get(symbol) or get_current_price(symbol)
         
         if current_price == 0:
             logger.warning(f"Could not get current price for {symbol}")
@@ -67,19 +73,46 @@ def evaluate_signal(signal):
         logger.error(f"Error evaluating signal {signal.get('id', 'unknown')}: {str(e)}")
         return None
 
+def evaluate_all_signals():
+    """
+    Evaluate all pending signals and update their results.
+    
+    All prices are read from a single tickers snapshot; only symbols missing
+    from it fall back to per-symbol lookups, which run in a thread pool.
+    Results are then written to storage from the calling thread.
+    
+    Returns:
+        Number of signals whose result was updated
+    """
+    pending_signals = get_pending_signals()
+    logger.info(f"Evaluating {len(pending_signals)} pending signals")
+    
+    if not pending_signals:
+        return 0
+        
+    prices = get_all_prices()
+    
+    if all(signal["symbol"] in prices for signal in pending_signals):
+        results = [evaluate_signal(signal, prices) for signal in pending_signals]
+    else:
+        with ThreadPoolExecutor(max_workers=min(EVALUATION_WORKERS, len(pending_signals))) as executor:
+            results = list(executor.map(lambda signal: evaluate_signal(signal, prices), pending_signals))
+        
+    updated = 0
+    for signal, result in zip(pending_signals, results):
+        if result:
+            update_signal_result(signal["id"], result)
+            logger.info(f"Signal {signal['id']} ({signal['symbol']}) updated to {result}")
+            updated += 1
+            
+    return updated
+
 def evaluate_signals_job():
     """
     Evaluate all pending signals and update their results.
     """
     try:
-        pending_signals = get_pending_signals()
-        logger.info(f"Evaluating {len(pending_signals)} pending signals")
-        
-        for signal in pending_signals:
-            result = evaluate_signal(signal)
-            if result:
-                update_signal_result(signal["id"], result)
-                logger.info(f"Signal {signal['id']} ({signal['symbol']}) updated to {result}")
+        evaluate_all_signals()
                 
     except Exception as e:
         logger.error(f"Error in signal evaluation job: {str(e)}")